@@ -0,0 +1,314 @@
+"""API HTTP/JSON local para reservas y disponibilidad.
+
+Expone `servicio_reservas` sin Streamlit para channel managers y la web:
+
+    GET  /salud
+    GET  /tipos
+    GET  /disponibilidad?checkin=AAAA-MM-DD&checkout=AAAA-MM-DD[&tipo=...]
+    POST /disponibilidad        {"rangos": [{"checkin", "checkout"}, ...], "tipos": [...]}
+    POST /reservas              {"cliente_id", "tipo", "checkin", "checkout", "huespedes", "observaciones"}
+    POST /reservas/lote         {"reservas": [...]}
+    POST /reservas/<id>/checkin {"observaciones"}
+    POST /reservas/<id>/checkout {"cargos_adicionales", "observaciones"}
+    POST /asignacion/reoptimizar {"aplicar", "dias_bloqueo", "bloqueadas"}
+
+La conexión a PostgreSQL se toma de las variables de entorno DB_HOST,
+DB_NAME, DB_USER, DB_PASSWORD y DB_PORT (las mismas claves que usa la app en
+`st.secrets`) y se comparte mediante un pool de conexiones.
+
+Uso:
+    python api_reservas.py --puerto 8502 --max-conexiones 20
+"""
+import argparse
+import json
+import math
+import os
+import re
+import threading
+from contextlib import contextmanager
+from datetime import date
+from decimal import Decimal
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+import psycopg2
+from psycopg2 import errors
+from psycopg2.pool import ThreadedConnectionPool
+
+import asignacion_habitaciones
+import servicio_reservas
+
+MAX_RANGOS_POR_LOTE = 366
+MAX_RESERVAS_POR_LOTE = 200
+
+RUTA_CHECKIN = re.compile(r"^/reservas/(\d+)/checkin$")
+RUTA_CHECKOUT = re.compile(r"^/reservas/(\d+)/checkout$")
+
+
+class ErrorSolicitud(Exception):
+    """Solicitud mal formada (HTTP 400)."""
+
+
+def parametros_conexion():
+    return {
+        "host": os.environ.get("DB_HOST", "localhost"),
+        "database": os.environ.get("DB_NAME", "hotel_california_db"),
+        "user": os.environ.get("DB_USER", "postgres"),
+        "password": os.environ.get("DB_PASSWORD", ""),
+        "port": os.environ.get("DB_PORT", "5432"),
+    }
+
+
+def _a_json(valor):
+    if isinstance(valor, Decimal):
+        return float(valor)
+    if isinstance(valor, date):
+        return valor.isoformat()
+    raise TypeError(f"Tipo no serializable: {type(valor).__name__}")
+
+
+def _fecha(valor, campo):
+    try:
+        return date.fromisoformat(valor)
+    except (TypeError, ValueError):
+        raise ErrorSolicitud(f"'{campo}' debe ser una fecha AAAA-MM-DD")
+
+
+def _rango(datos):
+    fecha_checkin = _fecha(datos.get("checkin"), "checkin")
+    fecha_checkout = _fecha(datos.get("checkout"), "checkout")
+    if fecha_checkout <= fecha_checkin:
+        raise ErrorSolicitud("'checkout' debe ser posterior a 'checkin'")
+    return fecha_checkin, fecha_checkout
+
+
+def _solicitud_reserva(datos):
+    if not isinstance(datos, dict):
+        raise ErrorSolicitud("Cada reserva debe ser un objeto JSON")
+    fecha_checkin, fecha_checkout = _rango(datos)
+    try:
+        solicitud = {
+            "cliente_id": int(datos["cliente_id"]),
+            "tipo": str(datos["tipo"]),
+            "fecha_checkin": fecha_checkin,
+            "fecha_checkout": fecha_checkout,
+            "huespedes": int(datos.get("huespedes", 1)),
+            "observaciones": str(datos.get("observaciones", "")),
+        }
+    except (KeyError, TypeError, ValueError) as e:
+        raise ErrorSolicitud(f"Reserva inválida: {e}")
+
+    minimo, maximo = servicio_reservas.HUESPEDES_MINIMOS, servicio_reservas.HUESPEDES_MAXIMOS
+    if not minimo <= solicitud["huespedes"] <= maximo:
+        raise ErrorSolicitud(f"'huespedes' debe estar entre {minimo} y {maximo}")
+    return solicitud
+
+
+def _cargos(datos):
+    valor = datos.get("cargos_adicionales", 0)
+    if isinstance(valor, bool):
+        raise ErrorSolicitud("'cargos_adicionales' debe ser numérico")
+    try:
+        cargos = float(valor)
+    except (TypeError, ValueError):
+        raise ErrorSolicitud("'cargos_adicionales' debe ser numérico")
+    # json.loads acepta NaN/Infinity y float() acepta "nan"/"inf"
+    if not math.isfinite(cargos) or cargos < 0:
+        raise ErrorSolicitud("'cargos_adicionales' debe ser un número finito no negativo")
+    return cargos
+
+
+class ManejadorAPI(BaseHTTPRequestHandler):
+    # Keep-alive: los clientes reutilizan la conexión TCP entre peticiones
+    protocol_version = "HTTP/1.1"
+    pool = None
+    cupos = None
+
+    @contextmanager
+    def conexion(self):
+        # El pool no espera cuando se agota; el semáforo hace que los hilos
+        # hagan cola en lugar de recibir PoolError.
+        with self.cupos:
+            conn = self.pool.getconn()
+            try:
+                yield conn
+            finally:
+                servicio_reservas.devolver_conexion(self.pool, conn)
+
+    def log_message(self, format, *args):
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+    def _responder(self, estado, cuerpo):
+        datos = json.dumps(cuerpo, default=_a_json).encode("utf-8")
+        self.send_response(estado)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(datos)))
+        self.end_headers()
+        self.wfile.write(datos)
+
+    def _leer_json(self):
+        try:
+            longitud = int(self.headers.get("Content-Length") or 0)
+        except ValueError:
+            longitud = -1
+        if longitud < 0:
+            # El cuerpo no se puede leer ni descartar: se cierra la conexión
+            # para que no se interprete como la siguiente petición
+            self.close_connection = True
+            raise ErrorSolicitud("Content-Length inválido")
+        if not longitud:
+            return {}
+        try:
+            datos = json.loads(self.rfile.read(longitud))
+        except ValueError:
+            raise ErrorSolicitud("El cuerpo no es JSON válido")
+        if not isinstance(datos, dict):
+            raise ErrorSolicitud("El cuerpo debe ser un objeto JSON")
+        return datos
+
+    def _despachar(self, manejador):
+        try:
+            estado, cuerpo = manejador()
+        except ErrorSolicitud as e:
+            estado, cuerpo = 400, {"error": str(e)}
+        except (servicio_reservas.ErrorReserva, asignacion_habitaciones.AgendaModificada) as e:
+            estado, cuerpo = 409, {"error": str(e)}
+        except errors.UniqueViolation as e:
+            estado, cuerpo = 409, {"error": servicio_reservas.describir_error(e)}
+        except (psycopg2.IntegrityError, psycopg2.DataError) as e:
+            # Cliente inexistente, valores fuera de rango o demasiado largos
+            estado, cuerpo = 400, {"error": servicio_reservas.describir_error(e)}
+        except Exception as e:
+            self.log_error("Error interno: %r", e)
+            estado, cuerpo = 500, {"error": "Error interno del servidor"}
+        self._responder(estado, cuerpo)
+
+    def do_GET(self):
+        self._despachar(self._get)
+
+    def do_POST(self):
+        self._despachar(self._post)
+
+    # Rutas
+    def _get(self):
+        url = urlsplit(self.path)
+        if url.path == "/salud":
+            return 200, {"estado": "ok"}
+        if url.path == "/tipos":
+            with self.conexion() as conn:
+                return 200, {"tipos": servicio_reservas.tipos_habitacion(conn)}
+        if url.path == "/disponibilidad":
+            query = {k: v[0] for k, v in parse_qs(url.query).items()}
+            tipos = [query["tipo"]] if query.get("tipo") else None
+            return 200, self._disponibilidad([_rango(query)], tipos)[0]
+        return 404, {"error": "Ruta no encontrada"}
+
+    def _post(self):
+        ruta = urlsplit(self.path).path
+        datos = self._leer_json()
+
+        if ruta == "/disponibilidad":
+            rangos = datos.get("rangos") or []
+            if not isinstance(rangos, list) or not 0 < len(rangos) <= MAX_RANGOS_POR_LOTE:
+                raise ErrorSolicitud(f"'rangos' debe tener entre 1 y {MAX_RANGOS_POR_LOTE} elementos")
+            tipos = datos.get("tipos")
+            if tipos is not None and not (isinstance(tipos, list) and all(isinstance(t, str) for t in tipos)):
+                raise ErrorSolicitud("'tipos' debe ser una lista de textos")
+            if not all(isinstance(r, dict) for r in rangos):
+                raise ErrorSolicitud("Cada rango debe ser un objeto con 'checkin' y 'checkout'")
+            return 200, {"resultados": self._disponibilidad([_rango(r) for r in rangos], tipos)}
+
+        if ruta == "/reservas":
+            solicitud = _solicitud_reserva(datos)
+            with self.conexion() as conn:
+                return 201, servicio_reservas.crear_reserva(conn, **solicitud)
+
+        if ruta == "/reservas/lote":
+            reservas = datos.get("reservas") or []
+            if not isinstance(reservas, list) or not 0 < len(reservas) <= MAX_RESERVAS_POR_LOTE:
+                raise ErrorSolicitud(f"'reservas' debe tener entre 1 y {MAX_RESERVAS_POR_LOTE} elementos")
+            solicitudes = [_solicitud_reserva(r) for r in reservas]
+            with self.conexion() as conn:
+                return 200, {"resultados": servicio_reservas.crear_reservas(conn, solicitudes)}
+
+        if ruta == "/asignacion/reoptimizar":
+            aplicar = datos.get("aplicar", False)
+            if not isinstance(aplicar, bool):
+                raise ErrorSolicitud("'aplicar' debe ser true o false")
+            bloqueadas = datos.get("bloqueadas", [])
+            if not isinstance(bloqueadas, list):
+                raise ErrorSolicitud("'bloqueadas' debe ser una lista de ids de reserva")
+            try:
+                dias_bloqueo = int(datos.get("dias_bloqueo", asignacion_habitaciones.DIAS_BLOQUEO))
+                bloqueadas = [int(r) for r in bloqueadas]
+            except (TypeError, ValueError):
+                raise ErrorSolicitud("'dias_bloqueo' y 'bloqueadas' deben ser enteros")
+            if dias_bloqueo < 0:
+                raise ErrorSolicitud("'dias_bloqueo' no puede ser negativo")
+            with self.conexion() as conn:
+                return 200, asignacion_habitaciones.reoptimizar(
+                    conn, dias_bloqueo=dias_bloqueo, bloqueadas=bloqueadas, aplicar=aplicar)
+
+        coincidencia = RUTA_CHECKIN.match(ruta)
+        if coincidencia:
+            with self.conexion() as conn:
+                numero = servicio_reservas.realizar_checkin(
+                    conn, int(coincidencia.group(1)), str(datos.get("observaciones", "")))
+            return 200, {"numero_reserva": numero, "estado": "en_estadia"}
+
+        coincidencia = RUTA_CHECKOUT.match(ruta)
+        if coincidencia:
+            cargos = _cargos(datos)
+            with self.conexion() as conn:
+                numero, total = servicio_reservas.realizar_checkout(
+                    conn, int(coincidencia.group(1)), cargos, str(datos.get("observaciones", "")))
+            return 200, {"numero_reserva": numero, "estado": "finalizada", "total": total}
+
+        return 404, {"error": "Ruta no encontrada"}
+
+    def _disponibilidad(self, rangos, tipos):
+        with self.conexion() as conn:
+            por_rango = servicio_reservas.disponibilidad_por_tipo(conn, rangos, tipos)
+        return [
+            {"checkin": inicio, "checkout": fin, "tipos": tipos_rango}
+            for (inicio, fin), tipos_rango in zip(rangos, por_rango)
+        ]
+
+
+def crear_servidor(host, puerto, min_conexiones, max_conexiones, verbose=False):
+    pool = ThreadedConnectionPool(min_conexiones, max_conexiones, **parametros_conexion())
+    manejador = type("Manejador", (ManejadorAPI,), {
+        "pool": pool,
+        "cupos": threading.BoundedSemaphore(max_conexiones),
+    })
+    servidor = ThreadingHTTPServer((host, puerto), manejador)
+    servidor.daemon_threads = True
+    servidor.verbose = verbose
+    servidor.pool = pool
+    return servidor
+
+
+def main():
+    parser = argparse.ArgumentParser(description="API de reservas del Hotel California")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--puerto", type=int, default=8502)
+    parser.add_argument("--min-conexiones", type=int, default=2)
+    parser.add_argument("--max-conexiones", type=int, default=20)
+    parser.add_argument("--verbose", action="store_true", help="Registrar cada petición")
+    args = parser.parse_args()
+
+    servidor = crear_servidor(args.host, args.puerto, args.min_conexiones,
+                              args.max_conexiones, args.verbose)
+    print(f"🏨 API de reservas escuchando en http://{args.host}:{args.puerto}")
+    try:
+        servidor.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        servidor.server_close()
+        servidor.pool.closeall()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,332 @@
+"""Motor de asignación de habitaciones del Hotel California.
+
+Elegir la primera habitación libre dispersa las estadías y deja huecos de
+una noche que no se pueden vender. Este módulo ofrece:
+
+* `elegir_habitacion`: best-fit para una nueva estadía, prefiriendo la
+  habitación cuyos huecos vecinos quedan cerrados o más ajustados.
+* `planificar_tipo` / `reoptimizar`: reasignación en lote de las reservas
+  confirmadas futuras no bloqueadas. Por cada tipo de habitación se recorre
+  la agenda por fecha de check-in (coloreado de un grafo de intervalos) y
+  cada estadía se coloca en la habitación que deja el menor hueco previo,
+  respetando las reservas bloqueadas.
+
+Uso:
+    python asignacion_habitaciones.py            # simulación, no modifica nada
+    python asignacion_habitaciones.py --aplicar  # guarda la nueva asignación
+"""
+import argparse
+import bisect
+import time
+from datetime import date, timedelta
+
+# Un hueco de menos noches que esto no se puede vender
+NOCHES_MINIMAS = 2
+
+# Peso de un lado sin reservas vecinas: peor que cualquier hueco real
+HOLGURA_ABIERTA = 100000
+
+# Estados que bloquean una habitación en un rango de fechas
+ESTADOS_OCUPADOS = ('confirmada', 'en_estadia')
+
+# Las reservas que empiezan antes de hoy + N días no se mueven (hoy y mañana)
+DIAS_BLOQUEO = 2
+
+
+class AgendaModificada(Exception):
+    """Alguna reserva del plan cambió mientras se calculaba; no se aplicó nada."""
+
+
+def _es_huerfano(hueco):
+    return hueco is not None and 0 < hueco < NOCHES_MINIMAS
+
+
+def puntaje_hueco(hueco_antes, hueco_despues):
+    """Menor es mejor: primero evita huecos invendibles, luego minimiza la holgura."""
+    huerfanos = _es_huerfano(hueco_antes) + _es_huerfano(hueco_despues)
+    holgura = sum(HOLGURA_ABIERTA if h is None else h for h in (hueco_antes, hueco_despues))
+    return huerfanos, holgura
+
+
+def elegir_habitacion(candidatas, fecha_checkin, fecha_checkout):
+    """Elige por best-fit entre habitaciones libres para el rango pedido.
+
+    `candidatas` son tuplas (id, numero, precio_noche, libre_desde, libre_hasta),
+    donde `libre_desde` es el check-out anterior y `libre_hasta` el siguiente
+    check-in de esa habitación (None si no hay). Devuelve la tupla elegida o
+    None si no hay candidatas.
+    """
+    def clave(candidata):
+        libre_desde, libre_hasta = candidata[3], candidata[4]
+        hueco_antes = (fecha_checkin - libre_desde).days if libre_desde else None
+        hueco_despues = (libre_hasta - fecha_checkout).days if libre_hasta else None
+        return puntaje_hueco(hueco_antes, hueco_despues), candidata[1]
+
+    return min(candidatas, key=clave, default=None)
+
+
+def buscar_candidatas(cur, tipo, fecha_checkin, fecha_checkout):
+    """Habitaciones libres del tipo con sus reservas vecinas más cercanas."""
+    cur.execute("""
+        SELECT h.id, h.numero, h.precio_noche,
+               (SELECT MAX(r.fecha_checkout) FROM reservas r
+                WHERE r.habitacion_id = h.id AND r.estado IN %s
+                AND r.fecha_checkout <= %s) as libre_desde,
+               (SELECT MIN(r.fecha_checkin) FROM reservas r
+                WHERE r.habitacion_id = h.id AND r.estado IN %s
+                AND r.fecha_checkin >= %s) as libre_hasta
+        FROM habitaciones h
+        WHERE h.tipo = %s AND h.activa = true
+        AND NOT EXISTS (
+            SELECT 1 FROM reservas r
+            WHERE r.habitacion_id = h.id
+            AND r.estado IN %s
+            AND r.fecha_checkin < %s AND r.fecha_checkout > %s
+        )
+    """, (ESTADOS_OCUPADOS, fecha_checkin, ESTADOS_OCUPADOS, fecha_checkout,
+          tipo, ESTADOS_OCUPADOS, fecha_checkout, fecha_checkin))
+    return cur.fetchall()
+
+
+# Reoptimización en lote
+def planificar_tipo(habitaciones, fijas, movibles):
+    """Reasigna las estadías movibles de un tipo de habitación.
+
+    - `habitaciones`: lista de (id, numero).
+    - `fijas`: lista de (habitacion_id, checkin, checkout) que no se mueven.
+    - `movibles`: lista de (reserva_id, checkin, checkout, habitacion_actual).
+
+    Devuelve {reserva_id: habitacion_id} para todas las movibles, o None si
+    el recorrido no encuentra sitio para alguna (se conserva la asignación
+    actual de ese tipo).
+    """
+    numeros = dict(habitaciones)
+
+    # Estadías fijas por habitación; el puntero marca la próxima pendiente
+    fijas_por_habitacion = {h: [] for h in numeros}
+    for habitacion_id, inicio, fin in fijas:
+        if habitacion_id in fijas_por_habitacion:
+            fijas_por_habitacion[habitacion_id].append((inicio, fin))
+    for lista in fijas_por_habitacion.values():
+        lista.sort()
+    puntero = {h: 0 for h in numeros}
+
+    def proxima_fija(habitacion_id):
+        lista = fijas_por_habitacion[habitacion_id]
+        return lista[puntero[habitacion_id]][0] if puntero[habitacion_id] < len(lista) else date.max
+
+    # Habitaciones ordenadas por la fecha en que quedan libres
+    libre_desde = {h: date.min for h in numeros}
+    por_libre = sorted((date.min, numeros[h], h) for h in numeros)
+
+    def actualizar(habitacion_id, nuevo_libre):
+        entrada = (libre_desde[habitacion_id], numeros[habitacion_id], habitacion_id)
+        del por_libre[bisect.bisect_left(por_libre, entrada)]
+        libre_desde[habitacion_id] = nuevo_libre
+        bisect.insort(por_libre, (nuevo_libre, numeros[habitacion_id], habitacion_id))
+
+    # Recorrido por check-in; a igual fecha las fijas se colocan primero
+    eventos = [(inicio, 0, fin, h, None) for h, inicio, fin in fijas if h in numeros]
+    eventos += [(inicio, 1, fin, actual, reserva_id) for reserva_id, inicio, fin, actual in movibles]
+    eventos.sort(key=lambda e: (e[0], e[1], e[2]))
+
+    plan = {}
+    for inicio, es_movible, fin, habitacion_actual, reserva_id in eventos:
+        if not es_movible:
+            puntero[habitacion_actual] += 1
+            actualizar(habitacion_actual, max(libre_desde[habitacion_actual], fin))
+            continue
+
+        # Desde el hueco previo más ajustado hacia atrás; se salta un hueco
+        # invendible si existe otra opción
+        elegida = respaldo = None
+        ultima = bisect.bisect_left(por_libre, (inicio + timedelta(days=1),))
+        for i in range(ultima - 1, -1, -1):
+            libre, _, habitacion_id = por_libre[i]
+            if proxima_fija(habitacion_id) < fin:
+                continue
+            hueco = (inicio - libre).days
+            if _es_huerfano(hueco):
+                if respaldo is None:
+                    respaldo = habitacion_id
+                continue
+            elegida = habitacion_id
+            break
+        if elegida is None:
+            elegida = respaldo
+        if elegida is None:
+            return None
+
+        # A igualdad de hueco se mantiene la habitación actual para evitar movimientos
+        if (habitacion_actual in libre_desde and habitacion_actual != elegida
+                and libre_desde[habitacion_actual] == libre_desde[elegida]
+                and proxima_fija(habitacion_actual) >= fin):
+            elegida = habitacion_actual
+
+        plan[reserva_id] = elegida
+        actualizar(elegida, fin)
+    return plan
+
+
+def medir_fragmentacion(estadias):
+    """Cuenta huecos entre estadías consecutivas de cada habitación.
+
+    `estadias` es una lista de (habitacion_id, checkin, checkout). Devuelve
+    (huecos_invendibles, noches_en_huecos).
+    """
+    por_habitacion = {}
+    for habitacion_id, inicio, fin in estadias:
+        por_habitacion.setdefault(habitacion_id, []).append((inicio, fin))
+
+    huerfanos = noches = 0
+    for lista in por_habitacion.values():
+        lista.sort()
+        for (_, fin_anterior), (inicio, _) in zip(lista, lista[1:]):
+            hueco = (inicio - fin_anterior).days
+            if hueco > 0:
+                noches += hueco
+                huerfanos += _es_huerfano(hueco)
+    return huerfanos, noches
+
+
+def reoptimizar(conn, desde=None, dias_bloqueo=DIAS_BLOQUEO, bloqueadas=(), tipos=None, aplicar=False):
+    """Reasigna las reservas confirmadas futuras para abrir capacidad contigua.
+
+    Se consideran bloqueadas (no se mueven) las reservas en estadía, las que
+    empiezan antes de `desde + dias_bloqueo` y los ids en `bloqueadas`. Con
+    `aplicar=False` solo calcula el plan. Devuelve un resumen por tipo.
+    """
+    desde = desde or date.today()
+    limite_bloqueo = desde + timedelta(days=dias_bloqueo)
+    bloqueadas = set(bloqueadas)
+    inicio_calculo = time.perf_counter()
+
+    try:
+        with conn.cursor() as cur:
+            if tipos is None:
+                cur.execute("SELECT DISTINCT tipo FROM habitaciones WHERE activa = true ORDER BY tipo")
+                tipos = [f[0] for f in cur.fetchall()]
+
+            # Mismo bloqueo que usa la creación de reservas
+            for tipo in sorted(tipos):
+                cur.execute("SELECT pg_advisory_xact_lock(hashtext(%s))", (tipo,))
+
+            cur.execute("""
+                SELECT id, numero, tipo FROM habitaciones
+                WHERE activa = true AND tipo = ANY(%s)
+            """, (list(tipos),))
+            habitaciones = cur.fetchall()
+
+            cur.execute("""
+                SELECT r.id, r.habitacion_id, h.tipo, r.fecha_checkin, r.fecha_checkout, r.estado
+                FROM reservas r
+                JOIN habitaciones h ON r.habitacion_id = h.id
+                WHERE r.estado IN %s
+                AND r.fecha_checkout > %s
+                AND h.activa = true AND h.tipo = ANY(%s)
+            """, (ESTADOS_OCUPADOS, desde, list(tipos)))
+            reservas = cur.fetchall()
+
+            resumen, cambios = {}, []
+            for tipo in tipos:
+                habitaciones_tipo = [(h[0], h[1]) for h in habitaciones if h[2] == tipo]
+                fijas, movibles = [], []
+                for reserva_id, habitacion_id, tipo_reserva, inicio, fin, estado in reservas:
+                    if tipo_reserva != tipo:
+                        continue
+                    if estado != 'confirmada' or inicio < limite_bloqueo or reserva_id in bloqueadas:
+                        fijas.append((habitacion_id, inicio, fin))
+                    else:
+                        movibles.append((reserva_id, inicio, fin, habitacion_id))
+
+                actuales = {m[0]: m[3] for m in movibles}
+                antes = medir_fragmentacion(fijas + [(m[3], m[1], m[2]) for m in movibles])
+                plan = planificar_tipo(habitaciones_tipo, fijas, movibles)
+                if plan is None:
+                    resumen[tipo] = {"factible": False, "movibles": len(movibles), "movimientos": 0,
+                                     "huecos_invendibles_antes": antes[0], "huecos_invendibles_despues": antes[0]}
+                    continue
+
+                despues = medir_fragmentacion(fijas + [(plan[m[0]], m[1], m[2]) for m in movibles])
+                # Solo se acepta el plan si reduce la fragmentación; con un
+                # empate se moverían huéspedes sin ganar nada
+                if despues >= antes:
+                    plan, despues = actuales, antes
+                movidas = [(r, h, actuales[r]) for r, h in plan.items() if h != actuales[r]]
+                cambios.extend(movidas)
+                resumen[tipo] = {
+                    "factible": True,
+                    "movibles": len(movibles),
+                    "movimientos": len(movidas),
+                    "huecos_invendibles_antes": antes[0],
+                    "huecos_invendibles_despues": despues[0],
+                    "noches_en_huecos_antes": antes[1],
+                    "noches_en_huecos_despues": despues[1],
+                }
+
+            if aplicar and cambios:
+                # Una sola sentencia: los intercambios entre habitaciones no se pisan
+                cur.execute("""
+                    UPDATE reservas r
+                    SET habitacion_id = c.nueva
+                    FROM unnest(%s::int[], %s::int[], %s::int[]) AS c(id, nueva, anterior)
+                    WHERE r.id = c.id AND r.habitacion_id = c.anterior AND r.estado = 'confirmada'
+                """, ([c[0] for c in cambios], [c[1] for c in cambios], [c[2] for c in cambios]))
+                # Check-in/out no toman el bloqueo por tipo: si alguna reserva
+                # cambió, aplicar el resto podría ocupar una habitación que el
+                # plan daba por liberada
+                if cur.rowcount != len(cambios):
+                    raise AgendaModificada(
+                        f"{len(cambios) - cur.rowcount} reservas cambiaron durante la "
+                        "reoptimización; no se aplicó ningún movimiento, vuelva a intentarlo")
+        if aplicar:
+            conn.commit()
+        else:
+            conn.rollback()
+    except Exception:
+        conn.rollback()
+        raise
+
+    return {
+        "aplicado": aplicar,
+        "segundos": round(time.perf_counter() - inicio_calculo, 3),
+        "tipos": resumen,
+    }
+
+
+def main():
+    import psycopg2
+
+    from api_reservas import parametros_conexion
+
+    parser = argparse.ArgumentParser(description="Reoptimiza la asignación de habitaciones")
+    parser.add_argument("--desde", type=date.fromisoformat, default=None, help="Fecha base (AAAA-MM-DD)")
+    parser.add_argument("--dias-bloqueo", type=int, default=DIAS_BLOQUEO,
+                        help="Las reservas que empiezan antes de desde + N días no se mueven")
+    parser.add_argument("--bloquear", type=int, nargs="*", default=(), help="Ids de reservas que no se mueven")
+    parser.add_argument("--aplicar", action="store_true", help="Guardar la nueva asignación")
+    args = parser.parse_args()
+
+    if args.dias_bloqueo < 0:
+        parser.error("--dias-bloqueo no puede ser negativo")
+
+    conn = psycopg2.connect(**parametros_conexion())
+    try:
+        resultado = reoptimizar(conn, args.desde, args.dias_bloqueo, args.bloquear, aplicar=args.aplicar)
+    except AgendaModificada as e:
+        parser.exit(1, f"❌ {e}\n")
+    finally:
+        conn.close()
+
+    for tipo, datos in resultado["tipos"].items():
+        if not datos["factible"]:
+            print(f"{tipo}: sin plan factible, se conserva la asignación actual")
+            continue
+        print(f"{tipo}: {datos['movimientos']}/{datos['movibles']} reservas movidas, "
+              f"huecos invendibles {datos['huecos_invendibles_antes']} → {datos['huecos_invendibles_despues']}, "
+              f"noches en huecos {datos['noches_en_huecos_antes']} → {datos['noches_en_huecos_despues']}")
+    print(f"{'Aplicado' if resultado['aplicado'] else 'Simulación'} en {resultado['segundos']}s")
+
+
+if __name__ == "__main__":
+    main()
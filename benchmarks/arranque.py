@@ -0,0 +1,112 @@
+"""Benchmark de arranque en frío de la aplicación Streamlit.
+
+Cada medición corre en un proceso Python nuevo y se repite varias veces
+(se informa la mediana):
+
+* import de streamlit (línea base),
+* ejecución del nivel superior de la app (lo que paga cada sesión nueva),
+* import de cada página con sus dependencias,
+* primer render de la pantalla de login con `streamlit.testing.v1.AppTest`.
+
+También comprueba que la app no cargue pandas/plotly antes de abrir una
+página que los necesite y que el login se pinte sin tocar la base de datos.
+
+Uso:
+    python benchmarks/arranque.py --repeticiones 5
+    python benchmarks/arranque.py --etiqueta v1.3 --csv benchmarks/arranque.csv
+"""
+import argparse
+import csv
+import json
+import os
+import statistics
+import subprocess
+import sys
+from datetime import datetime
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+APP = os.path.join(RAIZ, "app_ferreteria (1).py")
+
+MODULOS_PESADOS = ("pandas", "numpy", "plotly", "matplotlib", "seaborn")
+
+_PREAMBULO = f"""
+import json, sys, time
+sys.path.insert(0, {RAIZ!r})
+inicio = time.perf_counter()
+"""
+
+_EPILOGO = """
+segundos = time.perf_counter() - inicio
+pesados = sorted({m.split(".")[0] for m in sys.modules} & set(%r))
+print(json.dumps({"segundos": segundos, "pesados": pesados, "extra": extra}))
+""" % (MODULOS_PESADOS,)
+
+MEDICIONES = {
+    "import streamlit": "import streamlit\nextra = None",
+    "app (nivel superior)": (
+        "import runpy\n"
+        f"runpy.run_path({APP!r}, run_name='arranque')\n"
+        "extra = None"
+    ),
+    "página dashboard": "import paginas.dashboard\nextra = None",
+    "página reservas": "import paginas.reservas\nextra = None",
+    "página check-in/out": "import paginas.checkin_checkout\nextra = None",
+    "página clientes": "import paginas.clientes\nextra = None",
+    "página perfil": "import paginas.perfil\nextra = None",
+    "primer render (login)": (
+        "from streamlit.testing.v1 import AppTest\n"
+        f"at = AppTest.from_file({APP!r}, default_timeout=60)\n"
+        "at.run()\n"
+        "extra = {'excepciones': len(at.exception), 'errores': len(at.error)}"
+    ),
+}
+
+
+def medir(codigo):
+    salida = subprocess.run(
+        [sys.executable, "-c", _PREAMBULO + codigo + _EPILOGO],
+        cwd=RAIZ, capture_output=True, text=True, check=True,
+    )
+    return json.loads(salida.stdout.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark de arranque de la app")
+    parser.add_argument("--repeticiones", type=int, default=5)
+    parser.add_argument("--etiqueta", default="", help="Versión o release a registrar")
+    parser.add_argument("--csv", help="Agregar los resultados a este archivo CSV")
+    args = parser.parse_args()
+
+    filas = []
+    print(f"{'Medición':<26}{'mediana ms':>12}{'mín ms':>10}  módulos pesados")
+    for nombre, codigo in MEDICIONES.items():
+        resultados = [medir(codigo) for _ in range(args.repeticiones)]
+        tiempos = [r["segundos"] * 1000 for r in resultados]
+        pesados = resultados[-1]["pesados"]
+        mediana = statistics.median(tiempos)
+        print(f"{nombre:<26}{mediana:>12.1f}{min(tiempos):>10.1f}  {', '.join(pesados) or '-'}")
+        filas.append({"medicion": nombre, "mediana_ms": round(mediana, 1),
+                      "min_ms": round(min(tiempos), 1), "pesados": " ".join(pesados)})
+
+        if nombre == "app (nivel superior)" and pesados:
+            print(f"  ⚠️ La app carga {', '.join(pesados)} antes de abrir una página")
+        if nombre == "primer render (login)":
+            extra = resultados[-1]["extra"]
+            if extra["excepciones"] or extra["errores"]:
+                # Sin secrets de la base, un error aquí indica que se intentó conectar
+                print("  ⚠️ La pantalla de login mostró errores o excepciones")
+
+    if args.csv:
+        nuevo = not os.path.exists(args.csv)
+        with open(args.csv, "a", newline="", encoding="utf-8") as archivo:
+            escritor = csv.DictWriter(archivo, fieldnames=["fecha", "etiqueta", "medicion",
+                                                           "mediana_ms", "min_ms", "pesados"])
+            if nuevo:
+                escritor.writeheader()
+            fecha = datetime.now().isoformat(timespec="seconds")
+            for fila in filas:
+                escritor.writerow({"fecha": fecha, "etiqueta": args.etiqueta, **fila})
+
+
+if __name__ == "__main__":
+    main()
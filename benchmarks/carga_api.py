@@ -0,0 +1,118 @@
+"""Prueba de carga de la API de reservas (`api_reservas.py`).
+
+Lanza N hilos con conexiones HTTP persistentes contra el endpoint de
+disponibilidad durante un tiempo fijo y reporta peticiones por segundo,
+percentiles de latencia y errores. Objetivo: 1000 peticiones/s en un solo
+nodo contra PostgreSQL local.
+
+Uso:
+    python api_reservas.py --max-conexiones 20 &
+    python benchmarks/carga_api.py --concurrencia 32 --duracion 30
+    python benchmarks/carga_api.py --modo lote --rangos 14
+"""
+import argparse
+import http.client
+import json
+import random
+import statistics
+import threading
+import time
+from datetime import date, timedelta
+
+OBJETIVO_RPS = 1000
+
+
+def percentil(valores, p):
+    if not valores:
+        return 0.0
+    ordenados = sorted(valores)
+    indice = min(len(ordenados) - 1, int(round(p / 100 * (len(ordenados) - 1))))
+    return ordenados[indice]
+
+
+def _rango_aleatorio(rnd, dias_horizonte):
+    inicio = date.today() + timedelta(days=rnd.randint(0, dias_horizonte))
+    return inicio, inicio + timedelta(days=rnd.randint(1, 7))
+
+
+def _peticion(modo, rnd, args):
+    if modo == "simple":
+        inicio, fin = _rango_aleatorio(rnd, args.horizonte)
+        return "GET", f"/disponibilidad?checkin={inicio}&checkout={fin}", None
+    rangos = []
+    for _ in range(args.rangos):
+        inicio, fin = _rango_aleatorio(rnd, args.horizonte)
+        rangos.append({"checkin": inicio.isoformat(), "checkout": fin.isoformat()})
+    return "POST", "/disponibilidad", json.dumps({"rangos": rangos})
+
+
+def trabajador(args, fin_prueba, latencias, errores, semilla):
+    rnd = random.Random(semilla)
+    conexion = http.client.HTTPConnection(args.host, args.puerto, timeout=10)
+    propias, fallos = [], 0
+
+    while time.perf_counter() < fin_prueba:
+        metodo, ruta, cuerpo = _peticion(args.modo, rnd, args)
+        cabeceras = {"Content-Type": "application/json"} if cuerpo else {}
+        inicio = time.perf_counter()
+        try:
+            conexion.request(metodo, ruta, body=cuerpo, headers=cabeceras)
+            respuesta = conexion.getresponse()
+            respuesta.read()
+        except (OSError, http.client.HTTPException):
+            fallos += 1
+            conexion.close()
+            conexion = http.client.HTTPConnection(args.host, args.puerto, timeout=10)
+            continue
+        if respuesta.status == 200:
+            propias.append(time.perf_counter() - inicio)
+        else:
+            fallos += 1
+
+    conexion.close()
+    latencias.extend(propias)
+    errores.append(fallos)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Prueba de carga de la API de reservas")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--puerto", type=int, default=8502)
+    parser.add_argument("--concurrencia", type=int, default=32)
+    parser.add_argument("--duracion", type=float, default=30, help="Segundos de prueba")
+    parser.add_argument("--modo", choices=["simple", "lote"], default="simple",
+                        help="simple: GET de un rango; lote: POST con varios rangos")
+    parser.add_argument("--rangos", type=int, default=14, help="Rangos por petición en modo lote")
+    parser.add_argument("--horizonte", type=int, default=180, help="Días hacia adelante a consultar")
+    args = parser.parse_args()
+
+    latencias, errores = [], []
+    fin_prueba = time.perf_counter() + args.duracion
+    hilos = [
+        threading.Thread(target=trabajador, args=(args, fin_prueba, latencias, errores, i))
+        for i in range(args.concurrencia)
+    ]
+    inicio = time.perf_counter()
+    for hilo in hilos:
+        hilo.start()
+    for hilo in hilos:
+        hilo.join()
+    transcurrido = time.perf_counter() - inicio
+
+    rps = len(latencias) / transcurrido
+    print(f"Modo: {args.modo}  Concurrencia: {args.concurrencia}  Duración: {transcurrido:.1f}s")
+    print(f"Peticiones OK: {len(latencias)}  Errores: {sum(errores)}")
+    print(f"Peticiones/s: {rps:,.0f}" + (f"  (x{args.rangos} rangos)" if args.modo == "lote" else ""))
+    if latencias:
+        print("Latencia (ms): "
+              f"media {statistics.mean(latencias) * 1000:.1f}  "
+              f"p50 {percentil(latencias, 50) * 1000:.1f}  "
+              f"p95 {percentil(latencias, 95) * 1000:.1f}  "
+              f"p99 {percentil(latencias, 99) * 1000:.1f}")
+    if args.modo == "simple":
+        estado = "✅ cumple" if rps >= OBJETIVO_RPS else "❌ no cumple"
+        print(f"Objetivo {OBJETIVO_RPS} peticiones/s: {estado}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,302 @@
+"""Prueba de carga multi-sesión de la aplicación Streamlit.
+
+Ejecuta las páginas reales sin navegador con `streamlit.testing.v1.AppTest`
+contra un PostgreSQL local sembrado. Cada sesión simula a un recepcionista:
+inicia sesión, navega por las reservas, crea una reserva, hace check-in y
+check-out. Todas las sesiones corren como hilos de un mismo proceso, igual
+que en un servidor Streamlit, y comparten sus recursos cacheados (el pool
+de conexiones a la base incluido).
+
+`AppTest` no está pensado para ejecutarse en paralelo: en cada run reemplaza
+globales del proceso (`st.secrets` y `Runtime._instance`) y los restaura al
+terminar, pisando los de las otras sesiones. Por eso:
+
+* los datos de conexión se entregan una sola vez, en una sesión de
+  calentamiento que corre sola y deja creado el pool de `conexion.py`
+  (`st.cache_resource`); las sesiones concurrentes no necesitan secrets;
+* las páginas medidas no dependen de `Runtime.instance()` fuera de la
+  caché, pero un cambio que lo haga (subida de archivos, media) puede
+  fallar solo bajo esta prueba: revise las excepciones antes de atribuirlas
+  a la app.
+
+Para cada nivel de concurrencia se informa la latencia de rerun
+(p50/p95/p99), reruns por segundo, tasa de errores y conexiones en uso en
+`pg_stat_activity`; el resultado es la curva de capacidad de la versión.
+
+La conexión se toma de DB_HOST, DB_NAME, DB_USER, DB_PASSWORD y DB_PORT.
+
+Uso:
+    python benchmarks/carga_streamlit.py --sembrar
+    python benchmarks/carga_streamlit.py --sesiones 1 2 4 8 16 --ciclos 3
+    python benchmarks/carga_streamlit.py --etiqueta v1.3 --csv benchmarks/capacidad.csv
+"""
+import argparse
+import csv
+import os
+import random
+import sys
+import threading
+import time
+from datetime import date, datetime, timedelta
+
+import psycopg2
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+APP = os.path.join(RAIZ, "app_ferreteria (1).py")
+sys.path.insert(0, RAIZ)
+
+from api_reservas import parametros_conexion  # noqa: E402
+from carga_api import percentil  # noqa: E402
+
+USUARIO_CARGA = "carga"
+PASSWORD_CARGA = "carga123"
+TIPOS_SEMILLA = (("Simple", 1, 60), ("Doble", 2, 90), ("Suite", 4, 180))
+
+# Claves de st.secrets que lee conexion.init_pool
+CLAVES_SECRETS = {"DB_HOST": "host", "DB_NAME": "database", "DB_USER": "user",
+                  "DB_PASSWORD": "password", "DB_PORT": "port"}
+
+
+def sembrar(conn, habitaciones=60, clientes=50):
+    """Crea el usuario, los clientes y las habitaciones de la prueba si faltan."""
+    with conn.cursor() as cur:
+        cur.execute("""
+            INSERT INTO usuarios (username, password, nombre, rol, activo)
+            SELECT %s, %s, 'Recepcionista de carga', 'recepcionista', true
+            WHERE NOT EXISTS (SELECT 1 FROM usuarios WHERE username = %s)
+        """, (USUARIO_CARGA, PASSWORD_CARGA, USUARIO_CARGA))
+
+        for i in range(clientes):
+            cedula = f"CARGA-{i:04d}"
+            cur.execute("""
+                INSERT INTO clientes (cedula, nombre, telefono, email, direccion, nacionalidad)
+                SELECT %s, %s, '', '', '', ''
+                WHERE NOT EXISTS (SELECT 1 FROM clientes WHERE cedula = %s)
+            """, (cedula, f"Huésped de carga {i:04d}", cedula))
+
+        for i in range(habitaciones):
+            tipo, capacidad, precio = TIPOS_SEMILLA[i % len(TIPOS_SEMILLA)]
+            numero = f"C{i + 1:03d}"
+            cur.execute("""
+                INSERT INTO habitaciones (numero, tipo, capacidad, precio_noche, activa)
+                SELECT %s, %s, %s, %s, true
+                WHERE NOT EXISTS (SELECT 1 FROM habitaciones WHERE numero = %s)
+            """, (numero, tipo, capacidad, precio, numero))
+    conn.commit()
+
+
+class MonitorConexiones(threading.Thread):
+    """Muestrea las conexiones a la base mientras dura la prueba."""
+
+    def __init__(self, intervalo=0.2):
+        super().__init__(daemon=True)
+        self.intervalo = intervalo
+        self.muestras = []
+        self.detener = threading.Event()
+
+    def run(self):
+        conn = psycopg2.connect(**parametros_conexion())
+        conn.autocommit = True
+        try:
+            with conn.cursor() as cur:
+                while not self.detener.is_set():
+                    cur.execute("""
+                        SELECT COUNT(*), COUNT(*) FILTER (WHERE state <> 'idle')
+                        FROM pg_stat_activity
+                        WHERE datname = current_database() AND pid <> pg_backend_pid()
+                    """)
+                    self.muestras.append(cur.fetchone())
+                    self.detener.wait(self.intervalo)
+        finally:
+            conn.close()
+
+
+def _por_etiqueta(elementos, etiqueta):
+    return [e for e in elementos if e.label == etiqueta]
+
+
+class Sesion:
+    """Una sesión de recepcionista; registra la latencia de cada rerun."""
+
+    def __init__(self, semilla, timeout, con_secrets=False):
+        from streamlit.testing.v1 import AppTest
+
+        self.rnd = random.Random(semilla)
+        self.at = AppTest.from_file(APP, default_timeout=timeout)
+        if con_secrets:
+            parametros = parametros_conexion()
+            for secreto, clave in CLAVES_SECRETS.items():
+                self.at.secrets[secreto] = parametros[clave]
+        self.latencias = []
+        self.intentos = 0
+        self.excepciones = 0
+        self.errores_app = 0
+
+    def _rerun(self, paso, accion):
+        """Ejecuta un rerun; cuenta excepciones (o timeouts) y mensajes st.error."""
+        self.intentos += 1
+        inicio = time.perf_counter()
+        try:
+            accion()
+        except Exception:
+            self.excepciones += 1
+            return False
+        self.latencias.append((paso, time.perf_counter() - inicio))
+        if self.at.exception:
+            self.excepciones += 1
+        elif self.at.error:
+            self.errores_app += 1
+        return True
+
+    def _ir_a(self, menu):
+        return self._rerun(f"menú {menu}", lambda: self.at.sidebar.selectbox[0].select(menu).run())
+
+    def login(self):
+        if not self._rerun("primer render", self.at.run):
+            return False
+        self.at.sidebar.text_input[0].set_value(USUARIO_CARGA)
+        self.at.sidebar.text_input[1].set_value(PASSWORD_CARGA)
+        if not self._rerun("login", lambda: self.at.sidebar.button[0].click().run()):
+            return False
+        return "user" in self.at.session_state
+
+    def navegar_reservas(self):
+        self._ir_a("Reservas")
+        estado = self.rnd.choice(["Todas", "confirmada", "en_estadia", "finalizada"])
+        self._rerun("filtrar reservas", lambda: _por_etiqueta(self.at.selectbox, "Estado")[0].select(estado).run())
+
+    def reservar(self):
+        at = self.at
+        cliente = _por_etiqueta(at.selectbox, "Cliente*")
+        tipo = _por_etiqueta(at.selectbox, "Tipo de Habitación*")
+        if not cliente or not tipo:
+            self.intentos += 1
+            self.errores_app += 1
+            return
+        # Parte de las reservas empiezan hoy para que haya check-ins que hacer
+        checkin = date.today() + timedelta(days=self.rnd.choice([0, 0, 1, 3, 7, 14, 30]))
+        checkout = checkin + timedelta(days=self.rnd.randint(1, 4))
+        cliente[0].select(self.rnd.choice(cliente[0].options))
+        tipo[0].select(self.rnd.choice(tipo[0].options))
+        _por_etiqueta(at.date_input, "Fecha Check-in*")[0].set_value(checkin)
+        _por_etiqueta(at.date_input, "Fecha Check-out*")[0].set_value(checkout)
+        self._rerun("crear reserva", lambda: _por_etiqueta(at.button, "💾 Crear Reserva")[0].click().run())
+
+    def _accion_pendiente(self, paso, etiqueta):
+        botones = _por_etiqueta(self.at.button, etiqueta)
+        if botones:
+            boton = self.rnd.choice(botones)
+            self._rerun(paso, lambda: boton.click().run())
+
+    def checkin_checkout(self):
+        self._ir_a("Check-in/Check-out")
+        self._accion_pendiente("check-in", "✅ Realizar Check-in")
+        self._accion_pendiente("check-out", "✅ Realizar Check-out")
+
+    def ejecutar(self, ciclos):
+        try:
+            if not self.login():
+                return
+            for _ in range(ciclos):
+                self.navegar_reservas()
+                self.reservar()
+                self.checkin_checkout()
+        except Exception:
+            # Tras un rerun fallido o con timeout faltan elementos de la
+            # página (IndexError, etc.); la sesión termina y cuenta como error
+            self.intentos += 1
+            self.excepciones += 1
+
+
+def preparar_pool(timeout):
+    """Inicia sesión una vez, sin concurrencia, para crear el pool de la app.
+
+    Es la única sesión que recibe los secrets; mientras corre ninguna otra
+    puede restaurar `st.secrets` a vacío.
+    """
+    sesion = Sesion(semilla=-1, timeout=timeout, con_secrets=True)
+    try:
+        conectado = sesion.login()
+    except Exception:
+        conectado = False
+    if not conectado or sesion.excepciones or sesion.errores_app:
+        sys.exit("❌ La sesión de calentamiento no pudo iniciar sesión; revise la base y --sembrar")
+
+
+def medir_nivel(sesiones, ciclos, timeout, semilla):
+    monitor = MonitorConexiones()
+    monitor.start()
+    todas = [Sesion(semilla + i, timeout) for i in range(sesiones)]
+    hilos = [threading.Thread(target=s.ejecutar, args=(ciclos,)) for s in todas]
+
+    inicio = time.perf_counter()
+    for hilo in hilos:
+        hilo.start()
+    for hilo in hilos:
+        hilo.join()
+    transcurrido = time.perf_counter() - inicio
+    monitor.detener.set()
+    monitor.join()
+
+    latencias = [d for s in todas for _, d in s.latencias]
+    reruns = len(latencias)
+    excepciones = sum(s.excepciones for s in todas)
+    errores_app = sum(s.errores_app for s in todas)
+    intentos = max(sum(s.intentos for s in todas), 1)
+    return {
+        "sesiones": sesiones,
+        "reruns": reruns,
+        "reruns_s": round(reruns / transcurrido, 2),
+        "p50_ms": round(percentil(latencias, 50) * 1000, 1),
+        "p95_ms": round(percentil(latencias, 95) * 1000, 1),
+        "p99_ms": round(percentil(latencias, 99) * 1000, 1),
+        "excepciones_pct": round(excepciones / intentos * 100, 2),
+        "errores_app_pct": round(errores_app / intentos * 100, 2),
+        "conexiones_max": max((m[0] for m in monitor.muestras), default=0),
+        "conexiones_activas_max": max((m[1] for m in monitor.muestras), default=0),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Prueba de carga multi-sesión de la app Streamlit")
+    parser.add_argument("--sesiones", type=int, nargs="+", default=[1, 2, 4, 8, 16],
+                        help="Niveles de concurrencia a medir")
+    parser.add_argument("--ciclos", type=int, default=3, help="Repeticiones del guion por sesión")
+    parser.add_argument("--timeout", type=float, default=30, help="Segundos máximos por rerun")
+    parser.add_argument("--semilla", type=int, default=0)
+    parser.add_argument("--sembrar", action="store_true", help="Crear usuario, clientes y habitaciones de prueba")
+    parser.add_argument("--etiqueta", default="", help="Versión o release a registrar")
+    parser.add_argument("--csv", help="Agregar la curva de capacidad a este archivo CSV")
+    args = parser.parse_args()
+
+    if args.sembrar:
+        conn = psycopg2.connect(**parametros_conexion())
+        try:
+            sembrar(conn)
+        finally:
+            conn.close()
+
+    preparar_pool(args.timeout)
+
+    columnas = ["sesiones", "reruns", "reruns_s", "p50_ms", "p95_ms", "p99_ms",
+                "excepciones_pct", "errores_app_pct", "conexiones_max", "conexiones_activas_max"]
+    print("".join(f"{c:>14}" for c in columnas))
+    curva = []
+    for sesiones in args.sesiones:
+        fila = medir_nivel(sesiones, args.ciclos, args.timeout, args.semilla)
+        curva.append(fila)
+        print("".join(f"{fila[c]:>14}" for c in columnas))
+
+    if args.csv:
+        nuevo = not os.path.exists(args.csv)
+        with open(args.csv, "a", newline="", encoding="utf-8") as archivo:
+            escritor = csv.DictWriter(archivo, fieldnames=["fecha", "etiqueta"] + columnas)
+            if nuevo:
+                escritor.writeheader()
+            fecha = datetime.now().isoformat(timespec="seconds")
+            for fila in curva:
+                escritor.writerow({"fecha": fecha, "etiqueta": args.etiqueta, **fila})
+
+
+if __name__ == "__main__":
+    main()
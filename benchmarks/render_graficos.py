@@ -0,0 +1,87 @@
+"""Benchmark del pipeline de gráficos del dashboard (`graficos.py`).
+
+Con datos sintéticos, sin base de datos ni navegador, mide por separado:
+
+* construir la figura de tendencia (reducción LTTB + Plotly Express), lo
+  que se paga solo cuando la caché falla;
+* renderizarla, lo que se paga en cada rerun. Se reproduce lo que hace
+  `st.plotly_chart` (`plotly.tools.return_figure_from_figure_or_data` y
+  `plotly.io.to_json`) partiendo de un dict, como cuando la caché guardaba
+  JSON, y de un `Figure`, como ahora.
+
+Uso:
+    python benchmarks/render_graficos.py --dias 90 365 3650 --repeticiones 50
+"""
+import argparse
+import json
+import os
+import random
+import statistics
+import sys
+import time
+from datetime import date, timedelta
+
+import plotly.express as px
+import plotly.io as pio
+from plotly.tools import return_figure_from_figure_or_data
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, RAIZ)
+
+import graficos  # noqa: E402
+
+
+def serie_sintetica(dias, semilla=0):
+    rnd = random.Random(semilla)
+    hasta = date.today() - timedelta(days=1)
+    periodos = [hasta - timedelta(days=dias - 1 - i) for i in range(dias)]
+    valores = [max(0.0, min(100.0, 60 + 25 * rnd.gauss(0, 1))) for _ in range(dias)]
+    return periodos, valores
+
+
+def construir(periodos, valores):
+    x, y = graficos.reducir_puntos(periodos, valores)
+    return px.line(x=x, y=y, markers=len(x) <= 60,
+                   labels={"x": "Fecha", "y": "Ocupación %"}, title="Ocupación")
+
+
+def render_desde_dict(figura_json):
+    figura = return_figure_from_figure_or_data(json.loads(figura_json), validate_figure=True)
+    return pio.to_json(figura, validate=False)
+
+
+def render_desde_figura(figura):
+    figura = return_figure_from_figure_or_data(figura, validate_figure=True)
+    return pio.to_json(figura, validate=False)
+
+
+def cronometrar(funcion, repeticiones):
+    tiempos = []
+    for _ in range(repeticiones):
+        inicio = time.perf_counter()
+        funcion()
+        tiempos.append((time.perf_counter() - inicio) * 1000)
+    return statistics.median(tiempos)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark de gráficos del dashboard")
+    parser.add_argument("--dias", type=int, nargs="+", default=[90, 365, 3650])
+    parser.add_argument("--repeticiones", type=int, default=50)
+    args = parser.parse_args()
+
+    print(f"{'días':>6}{'puntos':>8}{'construir ms':>14}{'render dict ms':>16}{'render Figure ms':>18}")
+    for dias in args.dias:
+        periodos, valores = serie_sintetica(dias)
+        figura = construir(periodos, valores)
+        figura_json = figura.to_json()
+        puntos = len(figura.data[0].x)
+
+        ms_construir = cronometrar(lambda: construir(periodos, valores), args.repeticiones)
+        ms_dict = cronometrar(lambda: render_desde_dict(figura_json), args.repeticiones)
+        ms_figura = cronometrar(lambda: render_desde_figura(figura), args.repeticiones)
+        print(f"{dias:>6}{puntos:>8}{ms_construir:>14.2f}{ms_dict:>16.2f}{ms_figura:>18.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""Conexiones a PostgreSQL compartidas por las páginas de la aplicación.
+
+El pool se crea en el primer uso (normalmente al iniciar sesión), no al
+importar el módulo, para que cargar la app no espere a la base de datos.
+Cada consulta o llamada a la capa de servicio toma su propia conexión del
+pool, de modo que las transacciones de una sesión no se mezclan con las de
+otra.
+"""
+import threading
+from contextlib import contextmanager
+
+import streamlit as st
+from psycopg2.pool import ThreadedConnectionPool
+
+import servicio_reservas
+
+# Conexiones simultáneas por proceso de Streamlit
+MAX_CONEXIONES = 10
+
+# El pool no espera cuando se agota; el semáforo hace que las sesiones
+# hagan cola en lugar de recibir PoolError
+_cupos = threading.BoundedSemaphore(MAX_CONEXIONES)
+
+# Pool de conexiones a PostgreSQL. Si falla no se cachea y se reintenta en
+# la siguiente consulta.
+@st.cache_resource
+def init_pool():
+    return ThreadedConnectionPool(
+        1, MAX_CONEXIONES,
+        host=st.secrets["DB_HOST"],
+        database=st.secrets["DB_NAME"],
+        user=st.secrets["DB_USER"],
+        password=st.secrets["DB_PASSWORD"],
+        port=st.secrets["DB_PORT"]
+    )
+
+@contextmanager
+def obtener_conexion():
+    pool = init_pool()
+    with _cupos:
+        conn = pool.getconn()
+        try:
+            yield conn
+        finally:
+            servicio_reservas.devolver_conexion(pool, conn)
+
+# Función para ejecutar consultas
+def ejecutar_consulta(query, params=None):
+    try:
+        with obtener_conexion() as conn:
+            cur = conn.cursor()
+            if params:
+                cur.execute(query, params)
+            else:
+                cur.execute(query)
+            # INSERT/UPDATE no devuelven filas; el commit debe ocurrir igual,
+            # porque al devolver la conexión al pool se descarta lo pendiente
+            result = cur.fetchall() if cur.description else []
+            conn.commit()
+            cur.close()
+            return result
+    except Exception as e:
+        st.error(f"Error en consulta: {e}")
+        return None
+
+# Función para invocar la capa de servicio
+def ejecutar_servicio(funcion, *args):
+    try:
+        with obtener_conexion() as conn:
+            return funcion(conn, *args)
+    except servicio_reservas.ErrorReserva as e:
+        st.error(f"❌ {e}")
+        return None
+    except Exception as e:
+        st.error(f"Error en consulta: {e}")
+        return None
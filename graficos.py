@@ -0,0 +1,218 @@
+"""Pipeline de gráficos del dashboard.
+
+Las series se agregan en PostgreSQL a la granularidad adecuada (día, semana
+o mes según el rango), se reducen a un máximo de puntos y las figuras se
+guardan en `st.cache_resource`, con la versión de los datos como parte de
+la clave. Mientras las reservas no cambien, volver a abrir el dashboard
+evita las consultas de agregación y la construcción de las figuras.
+
+Lo que queda es el render: `st.plotly_chart` copia y serializa la figura en
+cada rerun, con un costo proporcional a los puntos (acotados por
+`PUNTOS_MAXIMOS`). Se cachean objetos `Figure` y no JSON porque Streamlit
+vuelve a validar las figuras que recibe como dict, pero no las que ya son
+`Figure`. `benchmarks/render_graficos.py` mide ambos caminos.
+
+Las tendencias terminan ayer y su versión solo mira las reservas que tocan
+la ventana, así que las reservas nuevas (que empiezan hoy o después) no
+invalidan su caché.
+"""
+from datetime import timedelta
+
+import pandas as pd
+import plotly.express as px
+import streamlit as st
+
+# Máximo de puntos por serie que se envían al navegador
+PUNTOS_MAXIMOS = 120
+
+# Figuras distintas a conservar (versiones x fechas x rangos)
+FIGURAS_EN_CACHE = 64
+
+# Estados que cuentan como noches ocupadas en las tendencias
+ESTADOS_OCUPACION = ('confirmada', 'en_estadia', 'finalizada')
+
+
+def version_datos(conn):
+    """Huella barata de las tablas que alimentan los gráficos.
+
+    Cambia al crear, cancelar, hacer check-in/out o modificar importes o
+    fechas de una reserva, y al activar o desactivar habitaciones.
+    """
+    with conn.cursor() as cur:
+        cur.execute("""
+            SELECT COUNT(*), COALESCE(MAX(id), 0), COALESCE(SUM(total), 0),
+                   COALESCE(SUM(fecha_checkout - fecha_checkin), 0),
+                   COALESCE(SUM(fecha_checkin - DATE '2000-01-01'), 0),
+                   COUNT(*) FILTER (WHERE estado = 'en_estadia'),
+                   COUNT(*) FILTER (WHERE estado = 'finalizada'),
+                   COUNT(*) FILTER (WHERE estado = 'cancelada'),
+                   (SELECT COUNT(*) FROM habitaciones WHERE activa = true)
+            FROM reservas
+        """)
+        version = cur.fetchone()
+    conn.commit()
+    return tuple(str(v) for v in version)
+
+
+def version_tendencia(conn, hasta, dias):
+    """Como `version_datos`, pero solo de las reservas que se solapan con la
+    ventana de `dias` días que termina en `hasta`."""
+    with conn.cursor() as cur:
+        cur.execute("""
+            SELECT COUNT(*), COALESCE(MAX(id), 0), COALESCE(SUM(total), 0),
+                   COALESCE(SUM(fecha_checkout - fecha_checkin), 0),
+                   COALESCE(SUM(fecha_checkin - DATE '2000-01-01'), 0),
+                   COUNT(*) FILTER (WHERE estado = 'en_estadia'),
+                   COUNT(*) FILTER (WHERE estado = 'finalizada'),
+                   COUNT(*) FILTER (WHERE estado = 'cancelada'),
+                   (SELECT COUNT(*) FROM habitaciones WHERE activa = true)
+            FROM reservas
+            WHERE fecha_checkin <= %s AND fecha_checkout > %s
+        """, (hasta, hasta - timedelta(days=dias - 1)))
+        version = cur.fetchone()
+    conn.commit()
+    return tuple(str(v) for v in version)
+
+
+def granularidad(dias, puntos_maximos=PUNTOS_MAXIMOS):
+    """Unidad de `date_trunc` más fina que no supera el presupuesto de puntos."""
+    if dias <= puntos_maximos:
+        return "day"
+    if dias / 7 <= puntos_maximos:
+        return "week"
+    return "month"
+
+
+def reducir_puntos(xs, ys, limite=PUNTOS_MAXIMOS):
+    """Reduce una serie a `limite` puntos con Largest-Triangle-Three-Buckets.
+
+    Conserva el primer y el último punto y, en cada tramo, el que mejor
+    mantiene la forma de la curva (picos y valles incluidos).
+    """
+    n = len(xs)
+    if limite >= n or limite < 3:
+        return list(xs), list(ys)
+
+    ys = [float(y) for y in ys]
+    elegidos = [0]
+    tramo = (n - 2) / (limite - 2)
+    anterior = 0
+    for i in range(limite - 2):
+        inicio = int(i * tramo) + 1
+        fin = int((i + 1) * tramo) + 1
+
+        # Promedio del tramo siguiente como tercer vértice del triángulo
+        sig_inicio, sig_fin = fin, min(int((i + 2) * tramo) + 1, n)
+        prom_x = (sig_inicio + sig_fin - 1) / 2
+        prom_y = sum(ys[sig_inicio:sig_fin]) / (sig_fin - sig_inicio)
+
+        mejor, mayor_area = inicio, -1.0
+        for j in range(inicio, fin):
+            area = abs((anterior - prom_x) * (ys[j] - ys[anterior])
+                       - (anterior - j) * (prom_y - ys[anterior]))
+            if area > mayor_area:
+                mejor, mayor_area = j, area
+        elegidos.append(mejor)
+        anterior = mejor
+    elegidos.append(n - 1)
+    return [xs[i] for i in elegidos], [ys[i] for i in elegidos]
+
+
+# `_conn` no forma parte de la clave de caché, `version` sí. Las figuras se
+# comparten entre sesiones: no modificarlas después de construirlas.
+@st.cache_resource(max_entries=FIGURAS_EN_CACHE, show_spinner=False)
+def figura_ocupacion_tipo(_conn, version, dia):
+    with _conn.cursor() as cur:
+        cur.execute("""
+            SELECT h.tipo,
+                   COUNT(*) as total_habitaciones,
+                   COUNT(CASE WHEN r.id IS NOT NULL THEN 1 END) as ocupadas
+            FROM habitaciones h
+            LEFT JOIN reservas r ON h.id = r.habitacion_id
+                AND %s BETWEEN r.fecha_checkin AND r.fecha_checkout
+                AND r.estado = 'confirmada'
+            WHERE h.activa = true
+            GROUP BY h.tipo
+        """, (dia,))
+        ocupacion_tipo = cur.fetchall()
+    _conn.commit()
+
+    if not ocupacion_tipo:
+        return None
+    df_ocupacion = pd.DataFrame(ocupacion_tipo, columns=['Tipo', 'Total', 'Ocupadas'])
+    df_ocupacion['Disponibles'] = df_ocupacion['Total'] - df_ocupacion['Ocupadas']
+
+    fig = px.bar(df_ocupacion, x='Tipo', y=['Ocupadas', 'Disponibles'],
+                 title='Estado de Habitaciones por Tipo')
+    return fig
+
+
+@st.cache_resource(max_entries=FIGURAS_EN_CACHE, show_spinner=False)
+def figura_reservas_estado(_conn, version, dia):
+    with _conn.cursor() as cur:
+        cur.execute("""
+            SELECT estado, COUNT(*) as cantidad
+            FROM reservas
+            WHERE fecha_checkin >= %s - INTERVAL '30 days'
+            GROUP BY estado
+        """, (dia,))
+        reservas_estado = cur.fetchall()
+    _conn.commit()
+
+    if not reservas_estado:
+        return None
+    df_estado = pd.DataFrame(reservas_estado, columns=['Estado', 'Cantidad'])
+    fig = px.pie(df_estado, values='Cantidad', names='Estado',
+                 title='Distribución de Reservas (Últimos 30 días)')
+    return fig
+
+
+@st.cache_resource(max_entries=FIGURAS_EN_CACHE, show_spinner=False)
+def figuras_tendencia(_conn, version, hasta, dias):
+    """Ocupación media (%) e ingresos por periodo de los últimos `dias` días.
+
+    Los ingresos de cada reserva se reparten por noche (total / noches).
+    `version` debe salir de `version_tendencia(conn, hasta, dias)`.
+    Devuelve (figura_ocupacion, figura_ingresos), o None.
+    """
+    unidad = granularidad(dias)
+    with _conn.cursor() as cur:
+        cur.execute("""
+            WITH diario AS (
+                SELECT d::date as dia,
+                       COUNT(r.id) as ocupadas,
+                       COALESCE(SUM(r.total / NULLIF(r.noches, 0)), 0) as ingresos
+                FROM generate_series(%s::date, %s::date, INTERVAL '1 day') d
+                LEFT JOIN reservas r ON r.fecha_checkin <= d::date
+                    AND r.fecha_checkout > d::date
+                    AND r.estado IN %s
+                GROUP BY d
+            )
+            SELECT date_trunc(%s, dia)::date as periodo,
+                   AVG(ocupadas) * 100.0 / NULLIF((SELECT COUNT(*) FROM habitaciones WHERE activa = true), 0),
+                   SUM(ingresos)
+            FROM diario
+            GROUP BY 1
+            ORDER BY 1
+        """, (hasta - timedelta(days=dias - 1), hasta, ESTADOS_OCUPACION, unidad))
+        serie = cur.fetchall()
+    _conn.commit()
+
+    if not serie:
+        return None
+    periodos = [f[0] for f in serie]
+    etiqueta = {"day": "día", "week": "semana", "month": "mes"}[unidad]
+
+    x, y = reducir_puntos(periodos, [float(f[1] or 0) for f in serie])
+    fig_ocupacion = px.line(x=x, y=y, markers=len(x) <= 60,
+                            labels={"x": "Fecha", "y": "Ocupación %"},
+                            title=f"Ocupación media por {etiqueta} (últimos {dias} días)")
+
+    x, y = reducir_puntos(periodos, [float(f[2]) for f in serie])
+    fig_ingresos = px.bar(x=x, y=y, labels={"x": "Fecha", "y": "Ingresos"},
+                          title=f"Ingresos por {etiqueta} (últimos {dias} días)")
+    return fig_ocupacion, fig_ingresos
+
+
+def mostrar(figura):
+    st.plotly_chart(figura, use_container_width=True)
@@ -0,0 +1 @@
+"""Páginas de la aplicación, cargadas bajo demanda desde el menú."""
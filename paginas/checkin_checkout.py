@@ -0,0 +1,96 @@
+"""Check-in y check-out de huéspedes."""
+import streamlit as st
+from datetime import date
+
+import servicio_reservas
+from conexion import ejecutar_servicio
+
+# Módulo de check-in/check-out
+def modulo_checkin_checkout():
+    st.title("🔑 Check-in / Check-out")
+
+    if "mensaje_exito" in st.session_state:
+        st.success(st.session_state.mensaje_exito)
+        del st.session_state.mensaje_exito
+
+    tab1, tab2 = st.tabs(["Check-in", "Check-out"])
+
+    with tab1:
+        st.subheader("📅 Check-in de Huéspedes")
+
+        # Reservas programadas para hoy o anteriores sin check-in
+        reservas_checkin = ejecutar_servicio(servicio_reservas.reservas_pendientes_checkin, date.today())
+
+        if reservas_checkin:
+            st.subheader("Reservas pendientes de check-in:")
+            
+            for reserva in reservas_checkin:
+                with st.expander(f"Reserva {reserva[1]} - {reserva[2]} - Habitación {reserva[3]}"):
+                    col1, col2 = st.columns(2)
+                    
+                    with col1:
+                        st.write(f"**Cliente:** {reserva[2]}")
+                        st.write(f"**Habitación:** {reserva[3]} ({reserva[4]})")
+                        st.write(f"**Fecha programada:** {reserva[5]}")
+                    
+                    with col2:
+                        st.write(f"**Huéspedes:** {reserva[6]}")
+                        st.write(f"**Total:** ${reserva[7]:,.2f}")
+                    
+                    with st.form(f"checkin_{reserva[0]}"):
+                        observaciones_checkin = st.text_area("Observaciones del check-in", key=f"obs_checkin_{reserva[0]}")
+                        
+                        if st.form_submit_button("✅ Realizar Check-in", use_container_width=True):
+                            # Actualizar estado de la reserva
+                            if ejecutar_servicio(servicio_reservas.realizar_checkin, reserva[0], observaciones_checkin):
+                                st.session_state.mensaje_exito = f"✅ Check-in realizado para reserva {reserva[1]}"
+                                st.rerun()
+        else:
+            st.info("No hay reservas pendientes de check-in para hoy")
+
+    with tab2:
+        st.subheader("🚪 Check-out de Huéspedes")
+
+        # Reservas en estadía que deben hacer checkout hoy o ya deberían haber salido
+        reservas_checkout = ejecutar_servicio(servicio_reservas.reservas_pendientes_checkout, date.today())
+
+        if reservas_checkout:
+            st.subheader("Huéspedes para check-out:")
+            
+            for reserva in reservas_checkout:
+                fecha_checkout = reserva[5]
+                es_tarde = fecha_checkout < date.today()
+                
+                with st.expander(f"{'🔴 TARDE - ' if es_tarde else ''}Reserva {reserva[1]} - {reserva[2]} - Habitación {reserva[3]}"):
+                    col1, col2 = st.columns(2)
+                    
+                    with col1:
+                        st.write(f"**Cliente:** {reserva[2]}")
+                        st.write(f"**Habitación:** {reserva[3]} ({reserva[4]})")
+                        st.write(f"**Check-out programado:** {reserva[5]}")
+                        if es_tarde:
+                            st.error("⚠️ Check-out atrasado")
+                    
+                    with col2:
+                        st.write(f"**Total:** ${reserva[6]:,.2f}")
+                        st.write(f"**Check-in realizado:** {reserva[7].strftime('%Y-%m-%d %H:%M') if reserva[7] else 'N/A'}")
+                    
+                    with st.form(f"checkout_{reserva[0]}"):
+                        observaciones_checkout = st.text_area("Observaciones del check-out", key=f"obs_checkout_{reserva[0]}")
+                        
+                        # Opcional: cargos adicionales
+                        cargos_adicionales = st.number_input("Cargos adicionales", min_value=0.0, step=0.1, key=f"cargos_{reserva[0]}")
+                        
+                        if st.form_submit_button("✅ Realizar Check-out", use_container_width=True):
+                            # Actualizar estado de la reserva
+                            resultado = ejecutar_servicio(
+                                servicio_reservas.realizar_checkout, reserva[0],
+                                cargos_adicionales, observaciones_checkout
+                            )
+
+                            if resultado:
+                                total_final = resultado[1]
+                                st.session_state.mensaje_exito = f"✅ Check-out realizado para reserva {reserva[1]}. Total final: ${total_final:,.2f}"
+                                st.rerun()
+        else:
+            st.info("No hay huéspedes pendientes de check-out")
@@ -0,0 +1,147 @@
+"""Gestión de clientes: listado, registro e historial de estadías."""
+import streamlit as st
+import pandas as pd
+
+from conexion import ejecutar_consulta
+
+# Módulo de clientes
+def modulo_clientes():
+    st.title("👥 Gestión de Clientes")
+
+    if "mensaje_exito" in st.session_state:
+        st.success(st.session_state.mensaje_exito)
+        del st.session_state.mensaje_exito
+
+    tab1, tab2, tab3 = st.tabs(["Lista de Clientes", "Registrar Cliente", "Historial"])
+
+    with tab1:
+        st.subheader("📋 Clientes Registrados")
+
+        buscar_cliente = st.text_input("🔍 Buscar cliente")
+        
+        query = """
+            SELECT c.cedula, c.nombre, c.telefono, c.email,
+                   c.fecha_registro,
+                   COUNT(r.id) as total_reservas,
+                   COALESCE(SUM(CASE WHEN r.estado != 'cancelada' THEN r.total ELSE 0 END), 0) as total_gastado
+            FROM clientes c
+            LEFT JOIN reservas r ON c.id = r.cliente_id
+        """
+        params = []
+
+        if buscar_cliente:
+            query += " WHERE (c.nombre ILIKE %s OR c.cedula ILIKE %s)"
+            params.extend([f"%{buscar_cliente}%", f"%{buscar_cliente}%"])
+
+        query += " GROUP BY c.id, c.cedula, c.nombre, c.telefono, c.email, c.fecha_registro ORDER BY c.nombre"
+
+        clientes = ejecutar_consulta(query, params) if params else ejecutar_consulta(query)
+
+        if clientes:
+            df_clientes = pd.DataFrame(clientes, columns=[
+                'Cédula', 'Nombre', 'Teléfono', 'Email', 'Fecha Registro', 'Total Reservas', 'Total Gastado'
+            ])
+
+            st.dataframe(
+                df_clientes,
+                column_config={
+                    "Total Gastado": st.column_config.NumberColumn(format="$%.2f"),
+                    "Fecha Registro": st.column_config.DatetimeColumn(format="DD/MM/YYYY")
+                },
+                use_container_width=True,
+                hide_index=True
+            )
+        else:
+            st.info("No se encontraron clientes")
+
+    with tab2:
+        st.subheader("➕ Registrar Nuevo Cliente")
+
+        with st.form("form_nuevo_cliente"):
+            col1, col2 = st.columns(2)
+
+            with col1:
+                cedula = st.text_input("Cédula/DNI*", max_chars=20)
+                nombre = st.text_input("Nombre Completo*", max_chars=100)
+                telefono = st.text_input("Teléfono", max_chars=20)
+
+            with col2:
+                email = st.text_input("Email", max_chars=100)
+                direccion = st.text_area("Dirección")
+                nacionalidad = st.text_input("Nacionalidad")
+
+            if st.form_submit_button("💾 Registrar Cliente", use_container_width=True):
+                if cedula and nombre:
+                    # Verificar si ya existe
+                    existe = ejecutar_consulta("SELECT id FROM clientes WHERE cedula = %s", (cedula,))
+                    if existe:
+                        st.error("❌ Ya existe un cliente con esta cédula")
+                    else:
+                        ejecutar_consulta("""
+                            INSERT INTO clientes (cedula, nombre, telefono, email, direccion, nacionalidad)
+                            VALUES (%s, %s, %s, %s, %s, %s)
+                        """, (cedula, nombre, telefono, email, direccion, nacionalidad))
+                        
+                        st.session_state.mensaje_exito = "✅ Cliente registrado exitosamente"
+                        st.rerun()
+                else:
+                    st.error("❌ Cédula y Nombre son obligatorios")
+
+    with tab3:
+        st.subheader("📋 Historial de Estadías")
+
+        clientes_con_reservas = ejecutar_consulta("""
+            SELECT DISTINCT c.id, c.cedula, c.nombre 
+            FROM clientes c
+            JOIN reservas r ON c.id = r.cliente_id
+            ORDER BY c.nombre
+        """)
+
+        if clientes_con_reservas:
+            cliente_opts = {f"{c[1]} - {c[2]}": c[0] for c in clientes_con_reservas}
+            cliente_hist = st.selectbox("Seleccionar Cliente", options=list(cliente_opts.keys()))
+
+            if cliente_hist:
+                cliente_id = cliente_opts[cliente_hist]
+
+                reservas_cliente = ejecutar_consulta("""
+                    SELECT r.numero_reserva, h.numero, h.tipo,
+                           r.fecha_checkin, r.fecha_checkout, r.noches,
+                           r.total, r.estado, r.checkin_real, r.checkout_real
+                    FROM reservas r
+                    JOIN habitaciones h ON r.habitacion_id = h.id
+                    WHERE r.cliente_id = %s
+                    ORDER BY r.fecha_checkin DESC
+                """, (cliente_id,))
+
+                if reservas_cliente:
+                    df_reservas = pd.DataFrame(reservas_cliente, columns=[
+                        'Reserva', 'Habitación', 'Tipo', 'Check-in', 'Check-out', 
+                        'Noches', 'Total', 'Estado', 'Check-in Real', 'Check-out Real'
+                    ])
+
+                    st.dataframe(
+                        df_reservas,
+                        column_config={
+                            "Total": st.column_config.NumberColumn(format="$%.2f"),
+                            "Check-in": st.column_config.DateColumn(),
+                            "Check-out": st.column_config.DateColumn(),
+                            "Check-in Real": st.column_config.DatetimeColumn(format="DD/MM/YYYY HH:mm"),
+                            "Check-out Real": st.column_config.DatetimeColumn(format="DD/MM/YYYY HH:mm")
+                        },
+                        use_container_width=True,
+                        hide_index=True
+                    )
+
+                    # Estadísticas del cliente
+                    total_gastado = sum(r[6] for r in reservas_cliente if r[7] != 'cancelada')
+                    total_noches = sum(r[5] for r in reservas_cliente if r[7] != 'cancelada')
+                    
+                    col1, col2, col3 = st.columns(3)
+                    col1.metric("Total Gastado", f"${total_gastado:,.2f}")
+                    col2.metric("Total Reservas", len(reservas_cliente))
+                    col3.metric("Total Noches", total_noches)
+                else:
+                    st.info("Este cliente no tiene reservas registradas")
+        else:
+            st.info("No hay clientes con historial de reservas")
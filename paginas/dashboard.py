@@ -0,0 +1,119 @@
+"""Dashboard principal: métricas del día, gráficos de ocupación y tendencias."""
+import streamlit as st
+import pandas as pd
+from datetime import timedelta, date
+
+import graficos
+from conexion import ejecutar_consulta, ejecutar_servicio
+
+# Dashboard principal
+def dashboard():
+    st.title("🏨 Dashboard - Hotel California")
+    st.markdown("*Such a lovely place*")
+
+    # Métricas del día
+    col1, col2, col3, col4 = st.columns(4)
+
+    with col1:
+        ocupadas_hoy = ejecutar_consulta("""
+            SELECT COUNT(*) FROM reservas r 
+            WHERE %s BETWEEN r.fecha_checkin AND r.fecha_checkout 
+            AND r.estado = 'confirmada'
+        """, (date.today(),))
+        total_habitaciones = ejecutar_consulta("SELECT COUNT(*) FROM habitaciones WHERE activa = true")
+        ocupacion = (ocupadas_hoy[0][0] / total_habitaciones[0][0] * 100) if total_habitaciones[0][0] > 0 else 0
+        st.metric("🛏️ Ocupación Hoy", f"{ocupacion:.1f}%")
+
+    with col2:
+        checkins_hoy = ejecutar_consulta("""
+            SELECT COUNT(*) FROM reservas 
+            WHERE fecha_checkin = %s AND estado = 'confirmada'
+        """, (date.today(),))
+        st.metric("📅 Check-ins Hoy", checkins_hoy[0][0] if checkins_hoy else 0)
+
+    with col3:
+        checkouts_hoy = ejecutar_consulta("""
+            SELECT COUNT(*) FROM reservas 
+            WHERE fecha_checkout = %s AND estado IN ('confirmada', 'en_estadia')
+        """, (date.today(),))
+        st.metric("🚪 Check-outs Hoy", checkouts_hoy[0][0] if checkouts_hoy else 0)
+
+    with col4:
+        ingresos_mes = ejecutar_consulta("""
+            SELECT COALESCE(SUM(total), 0) FROM reservas 
+            WHERE EXTRACT(MONTH FROM fecha_checkin) = EXTRACT(MONTH FROM CURRENT_DATE)
+            AND EXTRACT(YEAR FROM fecha_checkin) = EXTRACT(YEAR FROM CURRENT_DATE)
+            AND estado != 'cancelada'
+        """)
+        st.metric("💰 Ingresos Mes", f"${ingresos_mes[0][0]:,.2f}" if ingresos_mes else "$0")
+
+    st.markdown("---")
+
+    # Gráficos: figuras cacheadas por versión de los datos
+    version = ejecutar_servicio(graficos.version_datos)
+    col1, col2 = st.columns(2)
+
+    with col1:
+        st.subheader("🏠 Ocupación por Tipo de Habitación")
+        fig = ejecutar_servicio(graficos.figura_ocupacion_tipo, version, date.today()) if version else None
+        if fig is not None:
+            graficos.mostrar(fig)
+
+    with col2:
+        st.subheader("📊 Reservas por Estado")
+        fig = ejecutar_servicio(graficos.figura_reservas_estado, version, date.today()) if version else None
+        if fig is not None:
+            graficos.mostrar(fig)
+
+    # Tendencias de ocupación e ingresos
+    st.subheader("📈 Tendencias")
+    dias = st.radio("Periodo", [90, 365], format_func=lambda d: f"Últimos {d} días", horizontal=True)
+    # Hasta ayer: los días cerrados casi no cambian y la caché se reutiliza
+    hasta = date.today() - timedelta(days=1)
+    version_tendencia = ejecutar_servicio(graficos.version_tendencia, hasta, dias)
+    tendencia = (ejecutar_servicio(graficos.figuras_tendencia, version_tendencia, hasta, dias)
+                 if version_tendencia else None)
+
+    if tendencia:
+        col1, col2 = st.columns(2)
+        with col1:
+            graficos.mostrar(tendencia[0])
+        with col2:
+            graficos.mostrar(tendencia[1])
+
+    # Próximas llegadas y salidas
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.subheader("📅 Próximas Llegadas")
+        llegadas = ejecutar_consulta("""
+            SELECT r.numero_reserva, c.nombre, h.numero, r.fecha_checkin
+            FROM reservas r
+            JOIN clientes c ON r.cliente_id = c.id
+            JOIN habitaciones h ON r.habitacion_id = h.id
+            WHERE r.fecha_checkin BETWEEN %s AND %s
+            AND r.estado = 'confirmada'
+            ORDER BY r.fecha_checkin
+            LIMIT 5
+        """, (date.today(), date.today() + timedelta(days=2)))
+        
+        if llegadas:
+            df_llegadas = pd.DataFrame(llegadas, columns=['Reserva', 'Cliente', 'Habitación', 'Fecha'])
+            st.dataframe(df_llegadas, use_container_width=True, hide_index=True)
+
+    with col2:
+        st.subheader("🚪 Próximas Salidas")
+        salidas = ejecutar_consulta("""
+            SELECT r.numero_reserva, c.nombre, h.numero, r.fecha_checkout
+            FROM reservas r
+            JOIN clientes c ON r.cliente_id = c.id
+            JOIN habitaciones h ON r.habitacion_id = h.id
+            WHERE r.fecha_checkout BETWEEN %s AND %s
+            AND r.estado IN ('confirmada', 'en_estadia')
+            ORDER BY r.fecha_checkout
+            LIMIT 5
+        """, (date.today(), date.today() + timedelta(days=2)))
+        
+        if salidas:
+            df_salidas = pd.DataFrame(salidas, columns=['Reserva', 'Cliente', 'Habitación', 'Fecha'])
+            st.dataframe(df_salidas, use_container_width=True, hide_index=True)
@@ -0,0 +1,29 @@
+"""Perfil del usuario autenticado."""
+import streamlit as st
+
+from conexion import ejecutar_consulta
+
+# Perfil de usuario
+def perfil_usuario():
+    st.title("👤 Mi Perfil")
+    user = st.session_state.user
+
+    st.subheader("Información del Usuario")
+    st.write(f"**Usuario:** {user['username']}")
+    st.write(f"**Nombre:** {user['nombre']}")
+    st.write(f"**Rol:** {user['rol']}")
+
+    with st.form("form_editar_perfil"):
+        nuevo_nombre = st.text_input("Nombre", value=user['nombre'])
+        nuevo_email = st.text_input("Email", value=user.get('email', ""))
+        nueva_password = st.text_input("Nueva Contraseña", type="password")
+
+        if st.form_submit_button("💾 Actualizar Perfil"):
+            ejecutar_consulta("""
+                UPDATE usuarios
+                SET nombre = %s, email = %s, password = COALESCE(NULLIF(%s,''), password)
+                WHERE username = %s
+            """, (nuevo_nombre, nuevo_email, nueva_password, user['username']))
+            st.success("✅ Perfil actualizado exitosamente")
+            st.session_state.user['nombre'] = nuevo_nombre
+            st.session_state.user['email'] = nuevo_email
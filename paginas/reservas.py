@@ -0,0 +1,168 @@
+"""Gestión de reservas: listado, nueva reserva y disponibilidad."""
+import streamlit as st
+import pandas as pd
+from datetime import timedelta, date
+
+import servicio_reservas
+from conexion import ejecutar_consulta, ejecutar_servicio
+
+# Módulo de reservas
+def modulo_reservas():
+    st.title("📋 Gestión de Reservas")
+
+    if "mensaje_exito" in st.session_state:
+        st.success(st.session_state.mensaje_exito)
+        del st.session_state.mensaje_exito
+
+    tab1, tab2, tab3 = st.tabs(["Lista de Reservas", "Nueva Reserva", "Verificar Disponibilidad"])
+
+    with tab1:
+        st.subheader("📋 Reservas Registradas")
+        
+        # Filtros
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            filtro_estado = st.selectbox("Estado", ["Todas", "confirmada", "en_estadia", "finalizada", "cancelada"])
+        with col2:
+            filtro_fecha = st.date_input("Desde fecha", value=date.today() - timedelta(days=7))
+        with col3:
+            buscar_cliente = st.text_input("🔍 Buscar cliente")
+
+        # Consulta con filtros
+        query = """
+            SELECT r.numero_reserva, c.nombre, h.numero, h.tipo,
+                   r.fecha_checkin, r.fecha_checkout, r.noches,
+                   r.total, r.estado, r.fecha_creacion
+            FROM reservas r
+            JOIN clientes c ON r.cliente_id = c.id
+            JOIN habitaciones h ON r.habitacion_id = h.id
+            WHERE r.fecha_checkin >= %s
+        """
+        params = [filtro_fecha]
+
+        if filtro_estado != "Todas":
+            query += " AND r.estado = %s"
+            params.append(filtro_estado)
+
+        if buscar_cliente:
+            query += " AND c.nombre ILIKE %s"
+            params.append(f"%{buscar_cliente}%")
+
+        query += " ORDER BY r.fecha_creacion DESC"
+
+        reservas = ejecutar_consulta(query, params)
+        
+        if reservas:
+            df_reservas = pd.DataFrame(reservas, columns=[
+                'Reserva', 'Cliente', 'Habitación', 'Tipo', 'Check-in', 
+                'Check-out', 'Noches', 'Total', 'Estado', 'Fecha Creación'
+            ])
+            
+            st.dataframe(
+                df_reservas,
+                column_config={
+                    "Total": st.column_config.NumberColumn(format="$%.2f"),
+                    "Check-in": st.column_config.DateColumn(),
+                    "Check-out": st.column_config.DateColumn(),
+                    "Estado": st.column_config.TextColumn()
+                },
+                use_container_width=True,
+                hide_index=True
+            )
+        else:
+            st.info("No se encontraron reservas con los criterios seleccionados")
+
+    with tab2:
+        st.subheader("➕ Nueva Reserva")
+
+        with st.form("form_nueva_reserva"):
+            col1, col2 = st.columns(2)
+
+            with col1:
+                # Seleccionar cliente
+                clientes = ejecutar_consulta("SELECT id, cedula, nombre FROM clientes ORDER BY nombre")
+                if clientes:
+                    cliente_opts = {f"{c[1]} - {c[2]}": c[0] for c in clientes}
+                    cliente_seleccionado = st.selectbox("Cliente*", options=list(cliente_opts.keys()))
+                else:
+                    st.error("No hay clientes registrados. Registra un cliente primero.")
+                    cliente_seleccionado = None
+
+                fecha_checkin = st.date_input("Fecha Check-in*", value=date.today() + timedelta(days=1))
+                fecha_checkout = st.date_input("Fecha Check-out*", value=date.today() + timedelta(days=2))
+
+            with col2:
+                # Tipo de habitación
+                tipos_habitacion = ejecutar_servicio(servicio_reservas.tipos_habitacion)
+                if tipos_habitacion:
+                    tipo_habitacion = st.selectbox("Tipo de Habitación*", tipos_habitacion)
+                else:
+                    st.error("No hay tipos de habitación disponibles")
+                    tipo_habitacion = None
+
+                huespedes = st.number_input("Número de Huéspedes", min_value=1, max_value=6, value=1)
+                observaciones = st.text_area("Observaciones")
+
+            if st.form_submit_button("💾 Crear Reserva", use_container_width=True):
+                if cliente_seleccionado and fecha_checkin and fecha_checkout and tipo_habitacion:
+                    if fecha_checkout <= fecha_checkin:
+                        st.error("❌ La fecha de check-out debe ser posterior al check-in")
+                    else:
+                        cliente_id = cliente_opts[cliente_seleccionado]
+
+                        # Verificar disponibilidad e insertar reserva
+                        reserva = ejecutar_servicio(
+                            servicio_reservas.crear_reserva, cliente_id, tipo_habitacion,
+                            fecha_checkin, fecha_checkout, huespedes, observaciones
+                        )
+
+                        if reserva:
+                            st.session_state.mensaje_exito = f"✅ Reserva {reserva['numero_reserva']} creada exitosamente. Habitación: {reserva['habitacion']}"
+                            st.rerun()
+                else:
+                    st.error("❌ Todos los campos marcados con * son obligatorios")
+
+    with tab3:
+        st.subheader("🔍 Verificar Disponibilidad")
+
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            fecha_inicio = st.date_input("Fecha inicio", value=date.today())
+        with col2:
+            fecha_fin = st.date_input("Fecha fin", value=date.today() + timedelta(days=1))
+        with col3:
+            tipo_filtro = st.selectbox("Tipo de habitación", ["Todas"] + tipos_habitacion if tipos_habitacion else ["Todas"])
+
+        if st.button("🔍 Verificar Disponibilidad", use_container_width=True):
+            if fecha_fin <= fecha_inicio:
+                st.error("❌ La fecha fin debe ser posterior a la fecha inicio")
+            else:
+                disponibilidad = ejecutar_servicio(
+                    servicio_reservas.estado_habitaciones, fecha_inicio, fecha_fin,
+                    None if tipo_filtro == "Todas" else tipo_filtro
+                )
+
+                if disponibilidad:
+                    df_disponibilidad = pd.DataFrame(disponibilidad, columns=[
+                        'Habitación', 'Tipo', 'Capacidad', 'Precio/Noche', 'Estado'
+                    ])
+
+                    # Aplicar colores según disponibilidad
+                    def color_estado(val):
+                        color = 'lightgreen' if val == 'Disponible' else 'lightcoral'
+                        return f'background-color: {color}'
+
+                    styled_df = df_disponibilidad.style.applymap(
+                        color_estado, subset=['Estado']
+                    )
+
+                    st.dataframe(styled_df, use_container_width=True, hide_index=True)
+
+                    # Estadísticas
+                    disponibles = len(df_disponibilidad[df_disponibilidad['Estado'] == 'Disponible'])
+                    ocupadas = len(df_disponibilidad[df_disponibilidad['Estado'] == 'Ocupada'])
+                    
+                    col1, col2, col3 = st.columns(3)
+                    col1.metric("🟢 Disponibles", disponibles)
+                    col2.metric("🔴 Ocupadas", ocupadas)
+                    col3.metric("📊 Ocupación", f"{(ocupadas/(disponibles+ocupadas)*100):.1f}%" if (disponibles+ocupadas) > 0 else "0%")
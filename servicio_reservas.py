@@ -0,0 +1,313 @@
+"""Capa de servicio de reservas del Hotel California.
+
+Reúne la lógica de negocio (disponibilidad, creación de reservas, check-in y
+check-out) para que pueda usarse tanto desde la aplicación Streamlit como
+desde la API HTTP (`api_reservas.py`). Todas las funciones reciben una
+conexión psycopg2 abierta y no dependen de Streamlit.
+"""
+import math
+from datetime import datetime
+
+import psycopg2
+
+from asignacion_habitaciones import ESTADOS_OCUPADOS, buscar_candidatas, elegir_habitacion
+
+# Mismo rango que permite el formulario de Nueva Reserva
+HUESPEDES_MINIMOS = 1
+HUESPEDES_MAXIMOS = 6
+
+
+class ErrorReserva(Exception):
+    """Error de negocio (validación, falta de disponibilidad, estado inválido)."""
+
+
+# Utilidades internas
+def _consultar(conn, query, params=None):
+    with conn.cursor() as cur:
+        cur.execute(query, params)
+        return cur.fetchall()
+
+
+def devolver_conexion(pool, conn):
+    """Devuelve una conexión al pool cerrando cualquier transacción pendiente.
+
+    Si la conexión está rota (por ejemplo tras reiniciar PostgreSQL) el
+    rollback falla; aun así se devuelve al pool, cerrada, para no perder el
+    cupo.
+    """
+    descartar = bool(conn.closed)
+    try:
+        if not descartar:
+            conn.rollback()
+    except psycopg2.Error:
+        descartar = True
+    finally:
+        pool.putconn(conn, close=descartar or bool(conn.closed))
+
+
+def _validar_fechas(fecha_checkin, fecha_checkout):
+    if fecha_checkout <= fecha_checkin:
+        raise ErrorReserva("La fecha de check-out debe ser posterior al check-in")
+
+
+def describir_error(error):
+    """Mensaje corto para el cliente; evita exponer el detalle completo de psycopg2."""
+    if isinstance(error, psycopg2.Error) and error.diag.message_primary:
+        return error.diag.message_primary
+    return str(error)
+
+
+def generar_numero_reserva(reserva_id):
+    """Número de reserva legible; el id de la reserva lo hace único entre procesos."""
+    return f"RES{datetime.now().strftime('%Y%m%d%H%M%S')}{reserva_id:06d}"
+
+
+# Consultas de disponibilidad
+def tipos_habitacion(conn):
+    filas = _consultar(conn, "SELECT DISTINCT tipo FROM habitaciones WHERE activa = true ORDER BY tipo")
+    return [f[0] for f in filas]
+
+
+def estado_habitaciones(conn, fecha_inicio, fecha_fin, tipo=None):
+    """Detalle por habitación: (numero, tipo, capacidad, precio_noche, estado)."""
+    _validar_fechas(fecha_inicio, fecha_fin)
+    query = """
+        SELECT h.numero, h.tipo, h.capacidad, h.precio_noche,
+               CASE WHEN EXISTS (
+                   SELECT 1 FROM reservas r
+                   WHERE r.habitacion_id = h.id
+                   AND r.estado IN %s
+                   AND r.fecha_checkin < %s AND r.fecha_checkout > %s
+               ) THEN 'Ocupada' ELSE 'Disponible' END as estado
+        FROM habitaciones h
+        WHERE h.activa = true
+    """
+    params = [ESTADOS_OCUPADOS, fecha_fin, fecha_inicio]
+
+    if tipo:
+        query += " AND h.tipo = %s"
+        params.append(tipo)
+
+    query += " ORDER BY h.numero"
+    return _consultar(conn, query, params)
+
+
+def disponibilidad_por_tipo(conn, rangos, tipos=None):
+    """Disponibilidad agregada para varios rangos de fechas en una sola consulta.
+
+    `rangos` es una lista de tuplas (checkin, checkout). Devuelve una lista
+    paralela de diccionarios {tipo: {"total", "disponibles", "precio_noche"}}.
+    """
+    if not rangos:
+        return []
+    for fecha_checkin, fecha_checkout in rangos:
+        _validar_fechas(fecha_checkin, fecha_checkout)
+
+    filas = _consultar(conn, """
+        SELECT q.idx, h.tipo,
+               COUNT(*) as total,
+               SUM(CASE WHEN EXISTS (
+                   SELECT 1 FROM reservas r
+                   WHERE r.habitacion_id = h.id
+                   AND r.estado IN %s
+                   AND r.fecha_checkin < q.fin AND r.fecha_checkout > q.inicio
+               ) THEN 0 ELSE 1 END) as disponibles,
+               MIN(h.precio_noche) as precio_noche
+        FROM unnest(%s::date[], %s::date[]) WITH ORDINALITY AS q(inicio, fin, idx)
+        CROSS JOIN habitaciones h
+        WHERE h.activa = true
+        AND (%s::text[] IS NULL OR h.tipo = ANY(%s::text[]))
+        GROUP BY q.idx, h.tipo
+    """, (ESTADOS_OCUPADOS,
+          [r[0] for r in rangos], [r[1] for r in rangos],
+          list(tipos) if tipos else None, list(tipos) if tipos else None))
+
+    resultados = [{} for _ in rangos]
+    for idx, tipo, total, disponibles, precio_noche in filas:
+        resultados[idx - 1][tipo] = {
+            "total": total,
+            "disponibles": int(disponibles),
+            "precio_noche": precio_noche,
+        }
+    return resultados
+
+
+# Reservas
+def _bloquear_tipos(cur, tipos):
+    """Serializa hasta el commit las reservas concurrentes de esos tipos.
+
+    Los bloqueos se toman en orden alfabético, igual que en
+    `asignacion_habitaciones.reoptimizar`, para que dos transacciones con
+    varios tipos no se bloqueen mutuamente.
+    """
+    for tipo in sorted(set(tipos)):
+        cur.execute("SELECT pg_advisory_xact_lock(hashtext(%s))", (tipo,))
+
+
+def _insertar_reserva(cur, cliente_id, tipo, fecha_checkin, fecha_checkout, huespedes, observaciones,
+                      bloquear=True):
+    _validar_fechas(fecha_checkin, fecha_checkout)
+    if not HUESPEDES_MINIMOS <= huespedes <= HUESPEDES_MAXIMOS:
+        raise ErrorReserva(f"El número de huéspedes debe estar entre {HUESPEDES_MINIMOS} y {HUESPEDES_MAXIMOS}")
+
+    # En lote el llamador ya tomó los bloqueos de todos los tipos
+    if bloquear:
+        _bloquear_tipos(cur, [tipo])
+
+    candidatas = buscar_candidatas(cur, tipo, fecha_checkin, fecha_checkout)
+    habitacion = elegir_habitacion(candidatas, fecha_checkin, fecha_checkout)
+    if not habitacion:
+        raise ErrorReserva("No hay habitaciones disponibles para las fechas seleccionadas")
+
+    habitacion_id, numero_habitacion, precio_noche = habitacion[:3]
+    noches = (fecha_checkout - fecha_checkin).days
+    total = precio_noche * noches
+
+    # El id sale de la secuencia de la tabla, compartida por todos los procesos
+    cur.execute("SELECT nextval(pg_get_serial_sequence('reservas', 'id'))")
+    reserva_id = cur.fetchone()[0]
+    numero_reserva = generar_numero_reserva(reserva_id)
+
+    cur.execute("""
+        INSERT INTO reservas (id, numero_reserva, cliente_id, habitacion_id,
+                            fecha_checkin, fecha_checkout, noches, huespedes,
+                            total, observaciones, estado)
+        VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, 'confirmada')
+    """, (reserva_id, numero_reserva, cliente_id, habitacion_id, fecha_checkin,
+          fecha_checkout, noches, huespedes, total, observaciones))
+
+    return {
+        "id": reserva_id,
+        "numero_reserva": numero_reserva,
+        "habitacion_id": habitacion_id,
+        "habitacion": numero_habitacion,
+        "noches": noches,
+        "total": total,
+    }
+
+
+def crear_reserva(conn, cliente_id, tipo, fecha_checkin, fecha_checkout, huespedes=1, observaciones=""):
+    """Crea una reserva confirmada en la habitación del tipo pedido que mejor encaja."""
+    try:
+        with conn.cursor() as cur:
+            reserva = _insertar_reserva(cur, cliente_id, tipo, fecha_checkin,
+                                        fecha_checkout, huespedes, observaciones)
+        conn.commit()
+        return reserva
+    except Exception:
+        conn.rollback()
+        raise
+
+
+def crear_reservas(conn, solicitudes):
+    """Reserva en lote dentro de una única transacción.
+
+    Cada solicitud es un diccionario con las claves de `crear_reserva`. Un
+    fallo individual se revierte con su savepoint y se informa en la posición
+    correspondiente del resultado sin afectar al resto del lote.
+    """
+    resultados = []
+    try:
+        with conn.cursor() as cur:
+            # Todos los tipos del lote de una vez y en orden; tomarlos por
+            # ítem, en el orden del pedido, puede provocar un deadlock
+            _bloquear_tipos(cur, [s["tipo"] for s in solicitudes if "tipo" in s])
+            for solicitud in solicitudes:
+                cur.execute("SAVEPOINT reserva_lote")
+                try:
+                    reserva = _insertar_reserva(
+                        cur,
+                        solicitud["cliente_id"],
+                        solicitud["tipo"],
+                        solicitud["fecha_checkin"],
+                        solicitud["fecha_checkout"],
+                        solicitud.get("huespedes", 1),
+                        solicitud.get("observaciones", ""),
+                        bloquear=False,
+                    )
+                    cur.execute("RELEASE SAVEPOINT reserva_lote")
+                    resultados.append({"ok": True, **reserva})
+                except (ErrorReserva, KeyError, psycopg2.Error) as e:
+                    # Errores de la base (cliente inexistente, número duplicado,
+                    # desbordes) también se limitan a su propia reserva
+                    cur.execute("ROLLBACK TO SAVEPOINT reserva_lote")
+                    resultados.append({"ok": False, "error": describir_error(e)})
+        conn.commit()
+        return resultados
+    except Exception:
+        conn.rollback()
+        raise
+
+
+# Check-in / check-out
+def reservas_pendientes_checkin(conn, hoy):
+    return _consultar(conn, """
+        SELECT r.id, r.numero_reserva, c.nombre, h.numero, h.tipo,
+               r.fecha_checkin, r.huespedes, r.total
+        FROM reservas r
+        JOIN clientes c ON r.cliente_id = c.id
+        JOIN habitaciones h ON r.habitacion_id = h.id
+        WHERE r.estado = 'confirmada'
+        AND r.fecha_checkin <= %s
+        ORDER BY r.fecha_checkin, r.numero_reserva
+    """, (hoy,))
+
+
+def reservas_pendientes_checkout(conn, hoy):
+    return _consultar(conn, """
+        SELECT r.id, r.numero_reserva, c.nombre, h.numero, h.tipo,
+               r.fecha_checkout, r.total, r.checkin_real
+        FROM reservas r
+        JOIN clientes c ON r.cliente_id = c.id
+        JOIN habitaciones h ON r.habitacion_id = h.id
+        WHERE r.estado = 'en_estadia'
+        AND r.fecha_checkout <= %s + INTERVAL '1 day'
+        ORDER BY r.fecha_checkout, r.numero_reserva
+    """, (hoy,))
+
+
+def realizar_checkin(conn, reserva_id, observaciones=""):
+    """Pasa una reserva confirmada a 'en_estadia'. Devuelve el número de reserva."""
+    try:
+        with conn.cursor() as cur:
+            cur.execute("""
+                UPDATE reservas
+                SET estado = 'en_estadia',
+                    checkin_real = CURRENT_TIMESTAMP,
+                    observaciones = COALESCE(observaciones, '') || %s
+                WHERE id = %s AND estado = 'confirmada'
+                RETURNING numero_reserva
+            """, (f"\nCheck-in: {observaciones}", reserva_id))
+            fila = cur.fetchone()
+        if not fila:
+            raise ErrorReserva(f"La reserva {reserva_id} no está pendiente de check-in")
+        conn.commit()
+        return fila[0]
+    except Exception:
+        conn.rollback()
+        raise
+
+
+def realizar_checkout(conn, reserva_id, cargos_adicionales=0, observaciones=""):
+    """Finaliza una estadía sumando cargos adicionales. Devuelve (numero_reserva, total_final)."""
+    if not math.isfinite(cargos_adicionales) or cargos_adicionales < 0:
+        raise ErrorReserva("Los cargos adicionales deben ser un número finito no negativo")
+    try:
+        with conn.cursor() as cur:
+            cur.execute("""
+                UPDATE reservas
+                SET estado = 'finalizada',
+                    checkout_real = CURRENT_TIMESTAMP,
+                    total = total + %s,
+                    observaciones = COALESCE(observaciones, '') || %s
+                WHERE id = %s AND estado = 'en_estadia'
+                RETURNING numero_reserva, total
+            """, (cargos_adicionales, f"\nCheck-out: {observaciones}", reserva_id))
+            fila = cur.fetchone()
+        if not fila:
+            raise ErrorReserva(f"La reserva {reserva_id} no está en estadía")
+        conn.commit()
+        return fila[0], fila[1]
+    except Exception:
+        conn.rollback()
+        raise